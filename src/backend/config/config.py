@@ -5,6 +5,93 @@ env.read_env(".env")
 
 TEST_DATABASE_NAME = "test_db"
 PROXY_URL = f"https://proxy6.net/api/{env('PROXY_API_KEY')}"
+SCRAPERS_CONCURRENCY = env.int("SCRAPERS_CONCURRENCY", 2)
+SCRAPER_PARALLEL_WEEKS = env.int("SCRAPER_PARALLEL_WEEKS", 2)
+# "production" enables json logs, disables sql echo and debug level
+LOG_PROFILE = env("LOG_PROFILE", "development")
+DB_ECHO = env.bool("DB_ECHO", LOG_PROFILE != "production")
+# queries slower than threshold (seconds) are logged, only sampled part
+# of queries is timed
+SLOW_QUERY_THRESHOLD = env.float("SLOW_QUERY_THRESHOLD", 0.5)
+SLOW_QUERY_SAMPLE_RATE = env.float("SLOW_QUERY_SAMPLE_RATE", 0.1)
+# Cache-Control max-age in seconds for ingested weeks and index endpoints
+WEEK_MAX_AGE = env.int("WEEK_MAX_AGE", 7 * 24 * 60 * 60)
+INDEX_MAX_AGE = env.int("INDEX_MAX_AGE", 60)
+# cache of view responses, "memory" or "redis" shared by workers
+VIEW_CACHE_BACKEND = env("VIEW_CACHE_BACKEND", "memory")
+VIEW_CACHE_MAX_SIZE = env.int("VIEW_CACHE_MAX_SIZE", 64 * 1024 * 1024)
+VIEW_CACHE_TTLS = env.dict(
+    "VIEW_CACHE_TTLS",
+    subcast_values=int,
+    default={
+        "source": 10 * 60,
+        "source_type_detail": 10 * 60,
+        "detail": 24 * 60 * 60,
+    },
+)
+REDIS_URL = env("REDIS_URL", "redis://localhost:6379/0")
+# json serializer of api responses, "auto" uses orjson if it's installed
+JSON_SERIALIZER = env("JSON_SERIALIZER", "auto")
+# json responses smaller than given size in bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", 1024)
+# connection pool of web application engine
+DB_POOL_SIZE = env.int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = env.int("DB_MAX_OVERFLOW", 10)
+DB_POOL_PRE_PING = env.bool("DB_POOL_PRE_PING", True)
+DB_POOL_RECYCLE = env.int("DB_POOL_RECYCLE", 30 * 60)
+TITLE_METADATA_CACHE_SIZE = env.int("TITLE_METADATA_CACHE_SIZE", 1000)
+# connection pool of http client shared by all scrapers, resolved hosts
+# are cached for dns ttl (seconds)
+SCRAPER_CONNECTIONS = env.int("SCRAPER_CONNECTIONS", 15)
+SCRAPER_CONNECTIONS_PER_HOST = env.int("SCRAPER_CONNECTIONS_PER_HOST", 5)
+SCRAPER_DNS_TTL = env.int("SCRAPER_DNS_TTL", 5 * 60)
+SCRAPER_KEEPALIVE_TIMEOUT = env.float("SCRAPER_KEEPALIVE_TIMEOUT", 30)
+# proxy list is shared by all sessions and refreshed in background
+# when older than ttl (seconds), failed refresh is retried after given time
+PROXY_LIST_TTL = env.int("PROXY_LIST_TTL", 60 * 60)
+PROXY_LIST_RETRY = env.int("PROXY_LIST_RETRY", 60)
+# proxies are chosen by health from stats of requests in rolling window (seconds),
+# failing proxy is quarantined for time doubling with each consecutive error
+PROXY_STATS_WINDOW = env.int("PROXY_STATS_WINDOW", 10 * 60)
+PROXY_QUARANTINE = env.int("PROXY_QUARANTINE", 30)
+PROXY_MAX_QUARANTINE = env.int("PROXY_MAX_QUARANTINE", 30 * 60)
+# requests per second to scraped hosts (applies to subdomains too),
+# rates are halved on 429 responses and restored on successful ones
+SCRAPER_RATE = env.float("SCRAPER_RATE", 2)
+SCRAPER_HOST_RATES = env.dict(
+    "SCRAPER_HOST_RATES",
+    subcast_values=float,
+    default={
+        "amazon.co.jp": 0.33,
+        "mangaupdates.com": 1,
+        "cdjapan.co.jp": 1,
+        "oricon.co.jp": 2,
+    },
+)
+# failed requests of scrapers are retried with exponential backoff (seconds)
+# with jitter until attempts or time budget (seconds) of request run out
+SCRAPER_RETRY_ATTEMPTS = env.int("SCRAPER_RETRY_ATTEMPTS", 5)
+SCRAPER_RETRY_BUDGET = env.float("SCRAPER_RETRY_BUDGET", 120)
+SCRAPER_RETRY_BACKOFF = env.float("SCRAPER_RETRY_BACKOFF", 1)
+SCRAPER_RETRY_MAX_BACKOFF = env.float("SCRAPER_RETRY_MAX_BACKOFF", 30)
+SCRAPER_RETRY_STATUSES = env.list(
+    "SCRAPER_RETRY_STATUSES", subcast=int, default=[429, 502, 503, 504]
+)
+# response cache for scrapers is disabled if directory is not set
+SCRAPER_CACHE_DIR = env("SCRAPER_CACHE_DIR", None)
+SCRAPER_CACHE_MAX_SIZE = env.int("SCRAPER_CACHE_MAX_SIZE", 512 * 1024 * 1024)
+SCRAPER_CACHE_TTL = env.int("SCRAPER_CACHE_TTL", 24 * 60 * 60)
+SCRAPER_CACHE_HOST_TTLS = env.dict(
+    "SCRAPER_CACHE_HOST_TTLS",
+    subcast_values=int,
+    default={
+        "www.oricon.co.jp": 30 * 24 * 60 * 60,
+        "www.mangaupdates.com": 7 * 24 * 60 * 60,
+        "www.amazon.co.jp": 7 * 24 * 60 * 60,
+        "www.cdjapan.co.jp": 7 * 24 * 60 * 60,
+        "shosekiranking.blog.fc2.com": 60 * 60,
+    },
+)
 
 
 def get_postgres_uri(database_name: bool = True, test: bool = False) -> str:
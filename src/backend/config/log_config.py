@@ -0,0 +1,80 @@
+import logging
+import random
+import time
+from typing import Any
+from pythonjsonlogger import jsonlogger
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from config.config import (
+    LOG_PROFILE,
+    SLOW_QUERY_SAMPLE_RATE,
+    SLOW_QUERY_THRESHOLD,
+)
+
+slow_query_logger = logging.getLogger("sql.slow_query")
+
+
+def setup_logging(profile: str = LOG_PROFILE) -> None:
+    """Configure root logger for given profile. Production profile writes
+    json records with INFO level, any other keeps plain DEBUG output"""
+    if profile != "production":
+        logging.basicConfig(level=logging.DEBUG)
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+
+def log_slow_queries(
+    engine: AsyncEngine,
+    threshold: float = SLOW_QUERY_THRESHOLD,
+    sample_rate: float = SLOW_QUERY_SAMPLE_RATE,
+) -> None:
+    """Log statements that take longer than threshold seconds.
+        Only sample_rate part of statements is timed, so statements
+        that are not sampled cost single random call.
+
+    Args:
+        engine (AsyncEngine): engine which statements are timed
+        threshold (float, optional): duration in seconds. Defaults to SLOW_QUERY_THRESHOLD.
+        sample_rate (float, optional): part of timed statements from 0 to 1.
+            Defaults to SLOW_QUERY_SAMPLE_RATE.
+    """
+
+    def before_cursor_execute(  # pylint: disable=too-many-arguments, unused-argument
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info["query_start_time"] = (
+            time.perf_counter() if random.random() < sample_rate else None
+        )
+
+    def after_cursor_execute(  # pylint: disable=too-many-arguments, unused-argument
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        start = conn.info.pop("query_start_time", None)
+        if start is None:
+            return
+        duration = time.perf_counter() - start
+        if duration > threshold:
+            slow_query_logger.warning(
+                "Slow query",
+                extra={"duration": round(duration, 4), "statement": statement},
+            )
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
@@ -1,10 +1,17 @@
 from __future__ import annotations
 import asyncio
-import logging
+from typing import AsyncIterator
 from aiohttp import web
+from dependency_injector import providers
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from db.base import create_pooled_engine
+from db.session import get_request_session
+from config.log_config import setup_logging
 from config.middlewares import setup_middlewares
 from manga_sales.routes import setup_routes
 from config.schedule import run_schedule
+from manga_sales.containers import DatabaseContainer
 
 
 async def on_startup(
@@ -14,9 +21,23 @@ async def on_startup(
     await task
 
 
+async def database_ctx(app: web.Application) -> AsyncIterator[None]:
+    """Creates engine with connection pool once for application lifetime.
+    Views get session of current request, opened by db_middleware from the pool"""
+    engine = create_pooled_engine()
+    app["db_sessionmaker"] = sessionmaker(engine, class_=AsyncSession)
+    app["db_container"].session.override(providers.Callable(get_request_session))
+    yield
+    app["db_container"].session.reset_override()
+    await engine.dispose()
+
+
 async def create_app() -> web.Application:
-    logging.basicConfig(level=logging.DEBUG)
+    setup_logging()
     app = web.Application()
+    # container is created and wired once, not on every request
+    app["db_container"] = DatabaseContainer()
+    app.cleanup_ctx.append(database_ctx)
     setup_routes(app)
     # app.on_startup.append(on_startup)
     return app
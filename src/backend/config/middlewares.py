@@ -1,9 +1,13 @@
 import aiohttp_jinja2
 from aiohttp_session import get_session
 from aiohttp import web
+from aiohttp.helpers import ETag
 from aiohttp.typedefs import Handler
 from aiohttp.web_middlewares import _Middleware
-from manga_sales.containers import DatabaseContainer
+from config.config import COMPRESSION_MIN_SIZE
+from db.session import request_session
+from manga_sales.compression import compress, negotiate_encoding
+from manga_sales.http_cache import encoded_etag
 
 
 async def handle_404(request: web.Request) -> web.Response:
@@ -41,14 +45,56 @@ async def session_middleware(
 
 @web.middleware
 async def db_middleware(request: web.Request, handler: Handler) -> web.StreamResponse:
-    container = DatabaseContainer()
+    """Opens session from application pool for the time of request,
+    connection is taken from pool only when session is used"""
+    async with request.app["db_sessionmaker"]() as session:
+        token = request_session.set(session)
+        try:
+            return await handler(request)
+        finally:
+            request_session.reset(token)
+
+
+@web.middleware
+async def compression_middleware(
+    request: web.Request, handler: Handler
+) -> web.StreamResponse:
+    """Compresses json responses with content coding negotiated with client,
+    compressed representations get their own ETag. Responses compressed
+    beforehand (e.g. by view cache) are sent as is"""
     response = await handler(request)
-    await container.shutdown_resources()  # type: ignore # pylint: disable=no-member
+    if not isinstance(response, web.Response) or (
+        response.status != 304 and response.content_type != "application/json"
+    ):
+        return response
+    response.headers["Vary"] = "Accept-Encoding"
+    if "Content-Encoding" in response.headers:
+        return response
+    encoding = negotiate_encoding(request)
+    if encoding is None:
+        return response
+    etag = response.etag
+    body = response.body
+    if (
+        response.status == 200
+        and isinstance(body, bytes)
+        and len(body) >= COMPRESSION_MIN_SIZE
+    ):
+        response.body = compress(body, encoding)
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            response.etag = ETag(value=encoded_etag(etag.value, encoding))
+    elif response.status == 304 and etag is not None:
+        # keep ETag of compressed representation that client revalidates
+        tag = encoded_etag(etag.value, encoding)
+        if any(x.value == tag for x in request.if_none_match or ()):
+            response.etag = ETag(value=tag)
     return response
 
 
 def setup_middlewares(app: web.Application) -> None:
     error_middleware = create_error_middleware({404: handle_404, 500: handle_500})
     app.middlewares.append(error_middleware)
+    app.middlewares.append(compression_middleware)
     app.middlewares.append(db_middleware)
     # app.middlewares.append(session_middleware)
@@ -1,5 +1,6 @@
 import aioschedule as schedule
-from manga_scrapers.services.db_service import execute_scraper
+from config.config import SCRAPERS_CONCURRENCY
+from manga_scrapers.services.db_service import execute_scrapers, get_scraper_names
 
 
 async def run_schedule() -> None:
@@ -8,11 +9,4 @@ async def run_schedule() -> None:
 
 
 async def run_scrapers() -> None:
-    scraper_names = ["oricon_scraper", "shoseki_scraper"]
-    for name in scraper_names:
-        await execute_scraper(name)
-    # tasks = [
-    #     asyncio.create_task(execute_scraper(scraper_name))
-    #     for scraper_name in ["oricon_scraper", "shoseki_scraper"]
-    # ]
-    # asyncio.gather(*tasks)
+    await execute_scrapers(get_scraper_names(), SCRAPERS_CONCURRENCY)
@@ -6,7 +6,15 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
-from config.config import get_postgres_uri
+from config.config import (
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    get_postgres_uri,
+)
+from config.log_config import log_slow_queries
 
 if TYPE_CHECKING:
     TSession: TypeAlias = sessionmaker[  # pylint: disable = unsubscriptable-object
@@ -21,7 +29,23 @@ Base = declarative_base()
 async_engine: AsyncEngine = create_async_engine(
     get_postgres_uri(),
     future=True,
-    echo=True,
+    echo=DB_ECHO,
 )
+log_slow_queries(async_engine)
 # async_session_factory = sessionmaker(async_engine, class_=AsyncSession)
 Session: TSession = sessionmaker(async_engine, class_=AsyncSession)
+
+
+def create_pooled_engine() -> AsyncEngine:
+    """Create engine with connection pool configured for web application"""
+    engine = create_async_engine(
+        get_postgres_uri(),
+        future=True,
+        echo=DB_ECHO,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    log_slow_queries(engine)
+    return engine
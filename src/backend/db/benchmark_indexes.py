@@ -0,0 +1,172 @@
+"""Benchmark of hot query paths before and after hot path indexes migration.
+
+Creates separate database, seeds it with multi-year history, prints query plans
+of item and week lookups without and with indexes added by migration
+3f9a6c2e7d15 and drops database afterwards.
+
+Usage:
+    python -m db.benchmark_indexes --years 20 --items 30
+"""
+
+import argparse
+import asyncio
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from config.config import TEST_DATABASE_NAME, get_postgres_uri
+from db.base import Base
+import manga_sales.db.models  # noqa: F401  # pylint: disable=unused-import
+
+DATABASE_NAME = f"{TEST_DATABASE_NAME}_benchmark"
+MIGRATION = (
+    Path(__file__).parent / "migrations/versions/3f9a6c2e7d15_add_hot_path_indexes.py"
+)
+
+SEED = [
+    "INSERT INTO source (id, name) VALUES (1, 'oricon'), (2, 'shoseki')",
+    """INSERT INTO source_type (id, type, source_id)
+    VALUES (1, 'weekly', 1), (2, 'weekly', 2)""",
+    """INSERT INTO title (id, name)
+    SELECT x, 'title ' || x FROM generate_series(1, :titles) x""",
+    """INSERT INTO author (id, name)
+    SELECT x, 'author ' || x FROM generate_series(1, :titles) x""",
+    """INSERT INTO publisher (id, name)
+    SELECT x, 'publisher ' || x FROM generate_series(1, 50) x""",
+    """INSERT INTO week (id, date, source_type_id)
+    SELECT row_number() OVER (), CURRENT_DATE - 7 * w, st
+    FROM generate_series(0, :weeks - 1) w, generate_series(1, 2) st""",
+    """INSERT INTO item (rating, volume, week_id, title_id)
+    SELECT r, r % 40 + 1, week.id, (week.id * 7 + r * 13) % :titles + 1
+    FROM week, generate_series(1, :items) r""",
+    """INSERT INTO association_item_author (item_id, author_id)
+    SELECT id, title_id FROM item
+    UNION ALL SELECT id, (title_id + 1) % :titles + 1 FROM item""",
+    """INSERT INTO association_item_publisher (item_id, publisher_id)
+    SELECT id, title_id % 50 + 1 FROM item""",
+]
+
+# statements built by ItemDAO.get_instance, ItemDAO.get_previous_ranks,
+# WeekDAO.get_last_date and WeekDAO.get_previous_week
+QUERIES = {
+    "get_instance": """
+    SELECT item.id, item.rating, title.name,
+        array_agg(DISTINCT author.name), array_agg(DISTINCT publisher.name)
+    FROM item
+    JOIN week ON week.id = item.week_id
+    JOIN title ON title.id = item.title_id
+    LEFT JOIN association_item_author aa ON aa.item_id = item.id
+    LEFT JOIN author ON author.id = aa.author_id
+    LEFT JOIN association_item_publisher ap ON ap.item_id = item.id
+    LEFT JOIN publisher ON publisher.id = ap.publisher_id
+    WHERE week.date = :date
+    GROUP BY item.id, week.date, title.name
+    ORDER BY item.rating""",
+    "get_previous_ranks": """
+    SELECT title.name, min(item.rating) FROM item
+    JOIN title ON title.id = item.title_id
+    WHERE item.week_id = :week_id AND title.name = ANY(:names)
+    GROUP BY title.name""",
+    "get_last_date": """
+    SELECT week.date FROM week
+    WHERE week.source_type_id = 1
+    ORDER BY week.date DESC LIMIT 1""",
+    "get_previous_week": """
+    SELECT week.id FROM week
+    WHERE week.date < :date AND week.source_type_id = 1
+    ORDER BY week.date DESC LIMIT 1""",
+    "items_of_author": """
+    SELECT count(*) FROM association_item_author WHERE author_id = :author_id""",
+}
+
+
+def load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("migration", MIGRATION)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_migration(conn: Connection, upgrade: bool) -> None:
+    migration = load_migration()
+    with Operations.context(MigrationContext.configure(conn)):
+        if upgrade:
+            migration.upgrade()
+        else:
+            migration.downgrade()
+
+
+async def explain(conn: AsyncConnection, params: dict[str, object]) -> dict[str, float]:
+    """Print plan of every query and return their execution times in ms"""
+    timings = {}
+    for name, query in QUERIES.items():
+        result = await conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"), params
+        )
+        plan = result.scalar()[0]
+        timings[name] = plan["Execution Time"]
+        result = await conn.execute(text(f"EXPLAIN {query}"), params)
+        print(f"--- {name}: {timings[name]:.3f} ms")
+        print("\n".join(row[0] for row in result.all()))
+    return timings
+
+
+async def benchmark(years: int, items: int) -> None:
+    aux_engine = create_async_engine(get_postgres_uri(database_name=False))
+    async with aux_engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE_NAME}"))
+        await conn.execute(text(f"CREATE DATABASE {DATABASE_NAME}"))
+    engine = create_async_engine(get_postgres_uri(database_name=False) + DATABASE_NAME)
+    weeks = years * 52
+    seed_params = {"weeks": weeks, "items": items, "titles": weeks * items // 20}
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(run_migration, False)
+            for statement in SEED:
+                await conn.execute(text(statement), seed_params)
+            date = (
+                await conn.execute(
+                    text("SELECT date FROM week WHERE id = :id"), {"id": weeks}
+                )
+            ).scalar()
+        params = {
+            "date": date,
+            "week_id": weeks,
+            # titles of one scraped week
+            "names": [f"title {x}" for x in range(1, items + 1)],
+            "author_id": 1,
+        }
+        results = []
+        for upgrade in (False, True):
+            async with engine.begin() as conn:
+                if upgrade:
+                    await conn.run_sync(run_migration, True)
+                await conn.execute(text("ANALYZE"))
+                print(f"===== {'after' if upgrade else 'before'} migration")
+                results.append(await explain(conn, params))
+        print(f"===== {weeks} weeks per source type, {items} items per week")
+        for name in QUERIES:
+            print(
+                f"{name:<20} {results[0][name]:>10.3f} ms -> {results[1][name]:.3f} ms"
+            )
+    finally:
+        await engine.dispose()
+        async with aux_engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE_NAME}"))
+        await aux_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--items", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.years, args.items))
@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from typing import AsyncGenerator, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.base import Session
@@ -9,3 +10,11 @@ async def session(
 ) -> AsyncGenerator[DAOType, None] | AsyncSession:
     async with Session() as session_obj:
         yield model(session_obj) if model else session_obj
+
+
+# session of currently handled request, set by db_middleware
+request_session: ContextVar[AsyncSession] = ContextVar("request_session")
+
+
+def get_request_session() -> AsyncSession:
+    return request_session.get()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import functools
+import gzip
+from types import ModuleType
+from aiohttp import web
+
+# content codings in order of preference, br is used only if brotli is installed
+ENCODINGS = ("br", "gzip")
+# responses compressed once for cache get maximal compression level
+DYNAMIC_LEVELS = {"br": 5, "gzip": 6}
+STATIC_LEVELS = {"br": 11, "gzip": 9}
+
+
+@functools.lru_cache(maxsize=None)
+def _brotli() -> ModuleType | None:
+    # brotli is needed only for br content coding
+    try:
+        import brotli  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    module: ModuleType = brotli
+    return module
+
+
+def available_encodings() -> tuple[str, ...]:
+    return tuple(x for x in ENCODINGS if x != "br" or _brotli() is not None)
+
+
+def negotiate_encoding(request: web.Request) -> str | None:
+    """Choose most preferred available content coding accepted by client
+
+    Args:
+        request (web.Request)
+
+    Returns:
+        str | None: content coding or None if response should not be compressed
+    """
+    accepted: dict[str, float] = {}
+    for part in request.headers.get("Accept-Encoding", "").lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[coding.strip()] = quality
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """Compress body with given content coding
+
+    Args:
+        body (bytes): response body
+        encoding (str): "br" or "gzip"
+        static (bool, optional): use maximal compression level for bodies
+            that are compressed once and served many times. Defaults to False.
+
+    Returns:
+        bytes: compressed body
+    """
+    level = (STATIC_LEVELS if static else DYNAMIC_LEVELS)[encoding]
+    if encoding == "br":
+        brotli = _brotli()
+        assert brotli is not None
+        return bytes(brotli.compress(body, quality=level))
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_all(body: bytes) -> dict[str, bytes]:
+    """Compress body with all available content codings at maximal level"""
+    return {x: compress(body, x, static=True) for x in available_encodings()}
@@ -1,11 +1,14 @@
 from dependency_injector import containers, providers
 from manga_sales.db.data_access_layers.author import AuthorDAO
+from manga_sales.db.data_access_layers.chart_entry import ChartEntryDAO
 from manga_sales.db.data_access_layers.item import ItemDAO
 from manga_sales.db.data_access_layers.publisher import PublisherDAO
 from manga_sales.db.data_access_layers.source import SourceDAO
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
 from manga_sales.db.data_access_layers.title import TitleDAO
+from manga_sales.db.data_access_layers.title_metadata import TitleMetadataDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
+from manga_sales.db.data_access_layers.week_calendar import WeekCalendarDAO
 from db.session import session as db_session
 
 
@@ -25,6 +28,9 @@ class DatabaseContainer(containers.DeclarativeContainer):
     source_type = providers.Factory(SourceTypeDAO, session)
     authors = providers.Factory(AuthorDAO, session)
     item = providers.Factory(ItemDAO, session)
+    chart_entry = providers.Factory(ChartEntryDAO, session)
     publishers = providers.Factory(PublisherDAO, session)
     title = providers.Factory(TitleDAO, session)
+    title_metadata = providers.Factory(TitleMetadataDAO, session)
     week = providers.Factory(WeekDAO, session)
+    week_calendar = providers.Factory(WeekCalendarDAO, session)
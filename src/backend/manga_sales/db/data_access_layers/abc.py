@@ -1,7 +1,9 @@
 from abc import ABC
-from typing import Any, ClassVar, TypeVar
+from typing import Any, ClassVar, Type, TypeVar
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from manga_sales.db.models import TableType
+from sqlalchemy.future import select
+from manga_sales.db.models import Author, Publisher, TableType, Title
 
 DAOType = TypeVar("DAOType", bound="AbstractDAO")  # pylint: disable =invalid-name
 
@@ -19,3 +21,49 @@ class AbstractDAO(ABC):
 
     def add_all(self, items: list[Any]) -> None:
         self.session.add_all(items)
+
+
+class AbstractNamedDAO(AbstractDAO):
+    """Abstract base class for Data Access Layer of tables with unique name column"""
+
+    model: ClassVar[Type[Author] | Type[Publisher] | Type[Title]] = NotImplemented
+
+    async def upsert_by_name(self, names: list[str]) -> list[Any]:
+        """Insert rows for given names that don't exist yet and return all of them.
+            Uses 'INSERT ... ON CONFLICT (name) DO NOTHING RETURNING' so concurrent
+            inserts of the same name don't fail on unique constraint, rows that
+            were not inserted by this query are fetched with fallback select.
+
+        Args:
+            names (list[str]): list of names
+
+        Returns:
+            list[Any]: list of model instances for all given names in the same order
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        # sorted order keeps lock order the same for concurrent transactions
+        insert_query = (
+            insert(self.model)
+            .values([{"name": name} for name in sorted(names)])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(self.model)
+        )
+        results = await self.session.execute(
+            select(self.model)
+            .from_statement(insert_query)
+            .execution_options(populate_existing=True)
+        )
+        instances: dict[str, Any] = {
+            instance.name: instance for instance in results.scalars().all()
+        }
+        existed_names = [name for name in names if name not in instances]
+        if existed_names:
+            results = await self.session.execute(
+                select(self.model).where(self.model.name.in_(existed_names))
+            )
+            instances.update(
+                {instance.name: instance for instance in results.scalars().all()}
+            )
+        return [instances[name] for name in names]
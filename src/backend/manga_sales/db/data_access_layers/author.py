@@ -1,11 +1,11 @@
 from __future__ import annotations
 from sqlalchemy.future import select
 from sqlalchemy.engine.row import Row
-from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.data_access_layers.abc import AbstractNamedDAO
 from manga_sales.db.models import Author
 
 
-class AuthorDAO(AbstractDAO):
+class AuthorDAO(AbstractNamedDAO):
     """Data Acess Layer for author table"""
 
     model = Author
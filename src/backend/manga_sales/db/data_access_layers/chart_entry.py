@@ -0,0 +1,60 @@
+import datetime
+from typing import Iterable
+from sqlalchemy.engine.row import Row
+from sqlalchemy.future import select
+from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.models import ChartEntry
+
+
+class ChartEntryDAO(AbstractDAO):
+    """Data Acess Layer for chart entry table"""
+
+    model = ChartEntry
+
+    async def get_by_date(  # pylint: disable=too-many-arguments
+        self,
+        date_str: str,
+        columns: Iterable[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        after_rating: int | None = None,
+        week_ids: Iterable[int] | None = None,
+    ) -> list[Row]:
+        """Get chart entries of weeks with given date ordered by rating.
+            Uses single index range read without joins, only requested
+            columns are read.
+
+        Args:
+            date_str (str): string date
+            columns (Iterable[str] | None, optional): names of columns to select,
+                all columns are selected if not given. Defaults to None.
+            limit (int | None, optional): maximum number of rows. Defaults to None.
+            offset (int, optional): number of rows to skip. Defaults to 0.
+            after_rating (int | None, optional): select only rows with rating
+                greater than given one. Defaults to None.
+            week_ids (Iterable[int] | None, optional): select only rows of weeks
+                with given ids, e.g. weeks of single source type. Defaults to None.
+
+        Returns:
+            list[Row]: list of chart entry rows
+        """
+        date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+        selected = (
+            [getattr(self.model, column) for column in columns]
+            if columns is not None
+            else list(self.model.__table__.columns)
+        )
+        query = (
+            select(*selected)
+            .where(self.model.week_date == date)
+            .order_by(self.model.rating)
+            .offset(offset)
+            .limit(limit)
+        )
+        if after_rating is not None:
+            query = query.where(self.model.rating > after_rating)
+        if week_ids is not None:
+            query = query.where(self.model.week_id.in_(list(week_ids)))
+        result = await self.session.execute(query)
+        rows: list[Row] = result.all()
+        return rows
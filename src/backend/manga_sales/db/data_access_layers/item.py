@@ -1,6 +1,6 @@
 from __future__ import annotations
 import datetime
-from sqlalchemy import case, distinct, func
+from sqlalchemy import distinct, func
 from sqlalchemy.future import select
 from sqlalchemy.engine.row import Row
 from manga_sales.db.data_access_layers.abc import AbstractDAO
@@ -38,25 +38,41 @@ class ItemDAO(AbstractDAO):
         count: int = row.count if row else 0  # type: ignore
         return count
 
-    async def get_previous_rank(
-        self, week: Week, rank: int, title: str
-    ) -> PreviousRank | None:
+    async def get_previous_ranks(
+        self, week: Week, ranks: list[tuple[str, int]]
+    ) -> dict[tuple[str, int], PreviousRank]:
+        """Get previous rank for all titles of new week with single query.
+            Title ratings for given week are fetched once and compared
+            with new ranks.
+
+        Args:
+            week (Week): previous week
+            ranks (list[tuple[str, int]]): list of (title name, rank) pairs of new week
+
+        Returns:
+            dict[tuple[str, int], PreviousRank]: previous rank enum objects for
+            every (title name, rank) pair which title exists in given week
+        """
+        names = list({name for name, _ in ranks})
         query = (
-            select(
-                case(
-                    (self.model.rating > rank, PreviousRank.UP.name),
-                    (self.model.rating == rank, PreviousRank.SAME.name),
-                    (self.model.rating < rank, PreviousRank.DOWN.name),
-                ).label("rank")
-            )
+            select(Title.name, func.min(self.model.rating).label("rating"))
             .join(Title)
-            .where(self.model.week_id == week.id, Title.name == title)
-            .order_by(self.model.rating)
+            .where(self.model.week_id == week.id, Title.name.in_(names))
+            .group_by(Title.name)
         )
         result = await self.session.execute(query)
-        row = result.first()
-        rank_obj: PreviousRank | None = row.rank if row else None
-        return rank_obj
+        prev_ratings: dict[str, int] = {row.name: row.rating for row in result.all()}
+        prev_ranks: dict[tuple[str, int], PreviousRank] = {}
+        for name, rank in ranks:
+            if name not in prev_ratings:
+                continue
+            if prev_ratings[name] > rank:
+                prev_ranks[(name, rank)] = PreviousRank.UP
+            elif prev_ratings[name] == rank:
+                prev_ranks[(name, rank)] = PreviousRank.SAME
+            else:
+                prev_ranks[(name, rank)] = PreviousRank.DOWN
+        return prev_ranks
 
     async def get_instance(self, date_str: str) -> list[Row]:
         """Get item instance
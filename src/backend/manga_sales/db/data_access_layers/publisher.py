@@ -1,9 +1,9 @@
 from sqlalchemy.future import select
-from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.data_access_layers.abc import AbstractNamedDAO
 from manga_sales.db.models import Publisher
 
 
-class PublisherDAO(AbstractDAO):
+class PublisherDAO(AbstractNamedDAO):
     """Data Acess Layer for publisher table"""
 
     model = Publisher
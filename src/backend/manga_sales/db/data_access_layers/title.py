@@ -1,9 +1,9 @@
 from sqlalchemy.future import select
 from manga_sales.db.models import Title
-from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.data_access_layers.abc import AbstractNamedDAO
 
 
-class TitleDAO(AbstractDAO):
+class TitleDAO(AbstractNamedDAO):
     """Data Acess Layer for title table"""
 
     model = Title
@@ -0,0 +1,78 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.models import TitleMetadata
+
+
+class TitleMetadataDAO(AbstractDAO):
+    """Data Acess Layer for title metadata table"""
+
+    model = TitleMetadata
+
+    async def get_recent(self, limit: int) -> list[TitleMetadata]:
+        """Get most recently updated rows
+
+        Args:
+            limit (int): maximum number of rows
+
+        Returns:
+            list[TitleMetadata]: list of title metadata instances
+        """
+        result = await self.session.execute(
+            select(self.model).order_by(self.model.updated_at.desc()).limit(limit)
+        )
+        metadata: list[TitleMetadata] = result.scalars().all()
+        return metadata
+
+    async def get_by_original_titles(
+        self, original_titles: list[str]
+    ) -> list[TitleMetadata]:
+        """Get rows of given original titles with single query
+
+        Args:
+            original_titles (list[str]): original title names
+
+        Returns:
+            list[TitleMetadata]: list of title metadata instances of found titles
+        """
+        result = await self.session.execute(
+            select(self.model).where(self.model.original_title.in_(original_titles))
+        )
+        metadata: list[TitleMetadata] = result.scalars().all()
+        return metadata
+
+    async def upsert(
+        self, entries: dict[str, tuple[str, list[str], list[str]]]
+    ) -> None:
+        """Insert given entries or update existing rows with the same original title
+
+        Args:
+            entries (dict[str, tuple[str, list[str], list[str]]]): mapping of
+                original title to its name, authors and publishers
+        """
+        if not entries:
+            return
+        query = insert(self.model).values(
+            [
+                {
+                    "original_title": original_title,
+                    "name": name,
+                    "authors": authors,
+                    "publishers": publishers,
+                }
+                for original_title, (name, authors, publishers) in sorted(
+                    entries.items()
+                )
+            ]
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["original_title"],
+            set_={
+                "name": query.excluded.name,
+                "authors": query.excluded.authors,
+                "publishers": query.excluded.publishers,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(query)
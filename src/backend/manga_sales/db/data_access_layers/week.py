@@ -1,11 +1,11 @@
 import datetime
-from sqlalchemy import TEXT, cast, func
+from sqlalchemy import func
 from sqlalchemy.future import select
 from sqlalchemy.engine.row import Row
-from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert
 from manga_sales.db.data_access_layers.abc import AbstractDAO
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
-from manga_sales.db.models import SourceType, Week
+from manga_sales.db.models import Source, SourceType, Week
 
 
 class WeekDAO(AbstractDAO):
@@ -29,8 +29,7 @@ class WeekDAO(AbstractDAO):
         """Get week row given on date argument
 
         Args:
-            session (AsyncSession): sql session
-            date (datetime.date): _description_
+            date (datetime.date): week date
 
         Returns:
             Row | None: week row if exist else None
@@ -40,6 +39,34 @@ class WeekDAO(AbstractDAO):
         )
         return week.first()
 
+    async def create_if_absent(
+        self, date: datetime.date, source_type_id: int
+    ) -> Week | None:
+        """Insert week honouring unique constraint on date and source type.
+            If such week already exists (for example inserted by concurrent
+            scraper) nothing is inserted.
+
+        Args:
+            date (datetime.date): week date
+            source_type_id (int): id of source type
+
+        Returns:
+            Week | None: created week or None if week already exists
+        """
+        insert_query = (
+            insert(self.model)
+            .values(date=date, source_type_id=source_type_id)
+            .on_conflict_do_nothing(constraint="_source_week_const")
+            .returning(self.model)
+        )
+        result = await self.session.execute(
+            select(self.model)
+            .from_statement(insert_query)
+            .execution_options(populate_existing=True)
+        )
+        week: Week | None = result.scalars().first()
+        return week
+
     async def get_last_date(
         self, source: str, source_type: str
     ) -> datetime.date | None:
@@ -63,78 +90,77 @@ class WeekDAO(AbstractDAO):
         dte = results.first()
         return dte.date if dte else None
 
-    async def get_all_groupby(
-        self, source: str, source_type: str
-    ) -> list[dict[str, dict[str, list[int]]]]:
-        """
-        Get week date with group by by year and month if the following format:
-
-        Example: [
-                {
-                    '2021':
-                    {'September': [05], 'October': [7]},
-                    '2022':
-                    {'August': [22, 29], 'September': [5, 12, 19, 26], 'October': [3]}
-                }
-            ]
+    async def get_source_weeks(self, source: str) -> set[tuple[datetime.date, int]]:
+        """Get date and source type id pairs of all weeks of given source
+            with single query
 
         Args:
-            session (AsyncSession): sql session
+            source (str): source name
 
         Returns:
-            list[Week]: list of weeks with json groupby
+            set[tuple[datetime.date, int]]: set of (date, source_type_id) pairs
         """
-        week_type = await SourceTypeDAO(self.session).get_by_source(source, source_type)
+        query = (
+            select(self.model.date, self.model.source_type_id)
+            .join(SourceType)
+            .join(Source)
+            .where(Source.name == source.capitalize())
+        )
+        results = await self.session.execute(query)
+        return {(row.date, row.source_type_id) for row in results.all()}
 
-        assert week_type is not None
-        year = func.extract("year", self.model.date).label("year")
+    async def get_versions(
+        self, date: datetime.date, source: str, source_type: str
+    ) -> list[Row]:
+        """Get id and ingest time of weeks of given date and source type
 
-        month_str = (
-            func.to_char(
-                func.to_date(
-                    cast(func.extract("month", self.model.date), TEXT), "FMMM"
-                ),
-                "FMMonth",
+        Args:
+            date (datetime.date): week date
+            source (str): source name
+            source_type (str): source type name
+
+        Returns:
+            list[Row]: list of rows with id and created_at ordered by id
+        """
+        query = (
+            select(self.model.id, self.model.created_at)
+            .join(SourceType)
+            .join(Source)
+            .where(
+                self.model.date == date,
+                Source.name == source.capitalize(),
+                SourceType.type == source_type.capitalize(),
             )
-            .label("month_str")
-            .label("month_str")
+            .order_by(self.model.id)
         )
+        results = await self.session.execute(query)
+        versions: list[Row] = results.all()
+        return versions
 
-        aggregate_dates = func.json_agg(
-            aggregate_order_by(func.extract("day", self.model.date), self.model.date)
-        ).label("dates")
+    async def get_source_type_version(self, source: str, source_type: str) -> Row:
+        """Get number of weeks of given source type and latest ingest time
 
-        inner_maon_query = (
-            select(
-                year,
-                month_str,
-                func.extract("month", self.model.date).label("month_int"),
-                aggregate_dates,
-            )
-            .where(self.model.source_type_id == week_type.id)
-            .group_by("year", "month_str", "month_int")
-            .order_by("year", "month_int")
-            .subquery()
-        )
+        Args:
+            source (str): source name
+            source_type (str): source type name
 
-        aggregate_month = (
+        Returns:
+            Row: row with count and last_created_at
+        """
+        query = (
             select(
-                inner_maon_query.c.year,
-                func.json_object_agg(
-                    inner_maon_query.c.month_str,
-                    inner_maon_query.c.dates,
-                ).label("dates2"),
+                func.count(self.model.id).label("count"),
+                func.max(self.model.created_at).label("last_created_at"),
+            )
+            .join(SourceType)
+            .join(Source)
+            .where(
+                Source.name == source.capitalize(),
+                SourceType.type == source_type.capitalize(),
             )
-            .group_by(inner_maon_query.c.year)
-            .subquery()
         )
-
-        main_query = select(
-            func.json_object_agg(aggregate_month.c.year, aggregate_month.c.dates2)
-        ).group_by(aggregate_month.c.year)
-
-        data = await self.session.execute(main_query)
-        return data.scalars().all()
+        results = await self.session.execute(query)
+        return results.one()
 
     async def get_previous_week(
         self, week: Week, source_type: SourceType | Row
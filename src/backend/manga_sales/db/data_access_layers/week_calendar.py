@@ -0,0 +1,72 @@
+import calendar
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from manga_sales.db.data_access_layers.abc import AbstractDAO
+from manga_sales.db.models import Source, SourceType, Week, WeekCalendar
+
+
+class WeekCalendarDAO(AbstractDAO):
+    """Data Acess Layer for week calendar table"""
+
+    model = WeekCalendar
+
+    async def add_week(self, week: Week) -> None:
+        """Add day of given week to month of its source type calendar
+
+        Args:
+            week (Week): new week
+        """
+        query = insert(self.model).values(
+            source_type_id=week.source_type_id,
+            year=week.date.year,
+            month=week.date.month,
+            days=[week.date.day],
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["source_type_id", "year", "month"],
+            set_={
+                # keep days sorted and unique if weeks are ingested out of order
+                "days": literal_column(
+                    "ARRAY(SELECT DISTINCT unnest(week_calendar.days || excluded.days)"
+                    " ORDER BY 1)"
+                )
+            },
+        )
+        await self.session.execute(query)
+
+    async def get_by_source(
+        self, source: str, source_type: str
+    ) -> list[dict[str, dict[str, list[int]]]]:
+        """
+        Get week days of source type grouped by year and month with single query
+        in the following format:
+
+        Example: [
+                {'2021': {'September': [5], 'October': [7]}},
+                {'2022': {'August': [22, 29], 'September': [5, 12, 19, 26]}},
+            ]
+
+        Args:
+            source (str): source name
+            source_type (str): source type name
+
+        Returns:
+            list[dict[str, dict[str, list[int]]]]: calendar ordered by year and month
+        """
+        query = (
+            select(self.model.year, self.model.month, self.model.days)
+            .join(SourceType)
+            .join(Source)
+            .where(
+                Source.name == source.capitalize(),
+                SourceType.type == source_type.capitalize(),
+            )
+            .order_by(self.model.year, self.model.month)
+        )
+        result = await self.session.execute(query)
+        years: dict[str, dict[str, list[int]]] = {}
+        for row in result.all():
+            months = years.setdefault(str(row.year), {})
+            months[calendar.month_name[row.month]] = row.days
+        return [{year: months} for year, months in years.items()]
@@ -2,15 +2,20 @@ from __future__ import annotations
 import enum
 from typing import Type, Union
 from sqlalchemy import (
+    ARRAY,
     Column,
     String,
     Date,
+    DateTime,
     SmallInteger,
     Integer,
     ForeignKey,
     Table,
     UniqueConstraint,
     Enum,
+    Index,
+    func,
+    text,
 )
 from sqlalchemy.orm import relationship
 from db.base import Base
@@ -23,6 +28,9 @@ TableType = Union[
     Type["Publisher"],
     Type["Week"],
     Type["Title"],
+    Type["TitleMetadata"],
+    Type["ChartEntry"],
+    Type["WeekCalendar"],
 ]
 
 
@@ -86,11 +94,15 @@ class Week(Base):
     __tablename__ = "week"
     id = Column(Integer, primary_key=True)
     date = Column(Date, nullable=False)
+    # time of ingest, used to build ETag of week responses
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     source_type_id = Column(Integer, ForeignKey("source_type.id", ondelete="CASCADE"))
     source_type: SourceType = relationship("SourceType", back_populates="weeks")
     items: list[Item] = relationship("Item", back_populates="week")
     __table_args__ = (
         UniqueConstraint("date", "source_type_id", name="_source_week_const"),
+        # latest weeks of source type are read by get_last_date and get_previous_week
+        Index("ix_week_source_type_id_date", "source_type_id", text("date DESC")),
     )
 
     def __repr__(self) -> str:
@@ -100,14 +112,24 @@ class Week(Base):
 association_item_author = Table(
     "association_item_author",
     Base.metadata,
-    Column("item_id", ForeignKey("item.id", ondelete="CASCADE")),
-    Column("author_id", ForeignKey("author.id", ondelete="CASCADE")),
+    Column("item_id", ForeignKey("item.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "author_id",
+        ForeignKey("author.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
 )
 association_item_publisher = Table(
     "association_item_publisher",
     Base.metadata,
-    Column("item_id", ForeignKey("item.id", ondelete="CASCADE")),
-    Column("publisher_id", ForeignKey("publisher.id", ondelete="CASCADE")),
+    Column("item_id", ForeignKey("item.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "publisher_id",
+        ForeignKey("publisher.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
 )
 
 
@@ -137,11 +159,12 @@ class Item(Base):
     release_date = Column(Date)
     previous_rank = Column(Enum(PreviousRank), nullable=True)
     sold = Column(Integer, nullable=True)
-    image = Column(String, nullable=True, unique=True)
-    week_id = Column(Integer, ForeignKey("week.id", ondelete="CASCADE"))
+    # images are content-addressed, so items of the same volume share them
+    image = Column(String, nullable=True)
+    week_id = Column(Integer, ForeignKey("week.id", ondelete="CASCADE"), index=True)
     week: Week = relationship("Week", back_populates="items")
     title: Title = relationship("Title", back_populates="items")
-    title_id = Column(Integer, ForeignKey("title.id", ondelete="CASCADE"))
+    title_id = Column(Integer, ForeignKey("title.id", ondelete="CASCADE"), index=True)
     author: list[Author] = relationship(
         "Author",
         secondary=association_item_author,
@@ -209,3 +232,85 @@ class Publisher(Base):
         return (
             f"<{self.__class__.__name__}(" f"id={self.id}, " f"name={self.name}" f")>"
         )
+
+
+class TitleMetadata(Base):
+    """
+    Model for caching data about title collected from auxiliary sources,
+    keyed by original (japanese) title name
+    """
+
+    __tablename__ = "title_metadata"
+    original_title = Column(String(256), primary_key=True)
+    name = Column(String(256), nullable=False)
+    authors = Column(ARRAY(String(256)), nullable=False)
+    publishers = Column(ARRAY(String(256)), nullable=False)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"original_title={self.original_title}, "
+            f"name={self.name}"
+            f")>"
+        )
+
+
+class ChartEntry(Base):
+    """
+    Denormalised snapshot of item with all related data, written at ingest
+    so week chart can be read without joins and aggregation
+    """
+
+    __tablename__ = "chart_entry"
+    item_id = Column(
+        Integer, ForeignKey("item.id", ondelete="CASCADE"), primary_key=True
+    )
+    week_id = Column(
+        Integer, ForeignKey("week.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    week_date = Column(Date, nullable=False)
+    rating = Column(SmallInteger, nullable=False)
+    title = Column(String(256), nullable=False)
+    volume = Column(SmallInteger)
+    # formatted as in api response, e.g. 25-08-2022
+    release_date = Column(String(10))
+    authors = Column(ARRAY(String(256)), nullable=False)
+    publishers = Column(ARRAY(String(256)), nullable=False)
+    image = Column(String, nullable=True)
+    sold = Column(Integer, nullable=True)
+    previous_rank = Column(Enum(PreviousRank), nullable=True)
+    item: Item = relationship("Item")
+    __table_args__ = (Index("ix_chart_entry_week_date_rating", "week_date", "rating"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"item_id={self.item_id}, "
+            f"title={self.title}"
+            f")>"
+        )
+
+
+class WeekCalendar(Base):
+    """
+    Days of weeks of source type grouped by year and month, maintained at ingest
+    so calendar of source type can be read without aggregation
+    """
+
+    __tablename__ = "week_calendar"
+    source_type_id = Column(
+        Integer, ForeignKey("source_type.id", ondelete="CASCADE"), primary_key=True
+    )
+    year = Column(SmallInteger, primary_key=True)
+    month = Column(SmallInteger, primary_key=True)
+    days = Column(ARRAY(SmallInteger), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"source_type_id={self.source_type_id}, "
+            f"year={self.year}, "
+            f"month={self.month}"
+            f")>"
+        )
@@ -0,0 +1,44 @@
+import hashlib
+from aiohttp import web
+from aiohttp.helpers import ETAG_ANY, ETag
+
+
+def make_etag(*parts: object) -> str:
+    """Build strong ETag value from given parts"""
+    return hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of representation compressed with given content coding"""
+    return f"{etag}-{encoding}"
+
+
+def is_not_modified(request: web.Request, etag: str) -> bool:
+    """Check whether If-None-Match header of request matches given ETag
+    or ETag of its compressed representation"""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    return any(
+        tag.value in (etag, ETAG_ANY) or tag.value.rsplit("-", 1)[0] == etag
+        for tag in if_none_match
+    )
+
+
+def get_max_age(cache_control: str) -> int | None:
+    """Get max-age directive of Cache-Control header value"""
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age" and value.isdigit():
+            return int(value)
+    return None
+
+
+def set_cache_headers(response: web.Response, etag: str, max_age: int) -> web.Response:
+    response.etag = ETag(value=etag)
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return response
+
+
+def not_modified_response(etag: str, max_age: int) -> web.Response:
+    return set_cache_headers(web.Response(status=304), etag, max_age)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import datetime
+import enum
+import functools
+import json
+from typing import Any, Iterable
+from aiohttp import web
+from sqlalchemy.engine.row import Row
+from config.config import JSON_SERIALIZER
+
+
+def _default(obj: Any) -> Any:
+    """Encode types that are not supported by serializers natively"""
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes, dict)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONSerializer(ABC):
+    """Abstract serializer of api responses"""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize object to utf-8 encoded json. Besides json types dates,
+        enums, sql rows and any iterables (e.g. generators over query result)
+        are encoded"""
+
+
+class StdlibJSONSerializer(JSONSerializer):
+    """Serializer based on json module of standard library"""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+
+class OrjsonSerializer(JSONSerializer):
+    """Serializer based on orjson, that encodes dates, enums and dataclasses
+    natively and much faster than json module"""
+
+    def __init__(self) -> None:
+        # orjson is needed only for this serializer
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self.orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.orjson.dumps(
+            obj, default=_default, option=self.orjson.OPT_NON_STR_KEYS
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_serializer() -> JSONSerializer:
+    """Create serializer defined in config. With "auto" orjson is used
+    if it's installed. Instance is shared by whole process"""
+    if JSON_SERIALIZER == "json":
+        return StdlibJSONSerializer()
+    try:
+        return OrjsonSerializer()
+    except ImportError:
+        if JSON_SERIALIZER == "orjson":
+            raise
+        return StdlibJSONSerializer()
+
+
+def json_response(data: Any) -> web.Response:
+    """Build json response with body encoded by serializer defined in config
+
+    Args:
+        data (Any): response data
+
+    Returns:
+        web.Response: response with application/json content type
+    """
+    return web.Response(
+        body=get_serializer().dumps(data),
+        content_type="application/json",
+        charset="utf-8",
+    )
@@ -11,12 +11,14 @@ from config.config import get_postgres_uri, TEST_DATABASE_NAME
 from db.base import Base
 from manga_sales.db.models import (
     Author,
+    ChartEntry,
     Item,
     Publisher,
     Source,
     SourceType,
     Title,
     Week,
+    WeekCalendar,
 )
 
 
@@ -150,4 +152,31 @@ async def create_data(class_session_factory) -> None:
         session.add_all(pytest.publishers)
         session.add_all(pytest.titles)
         session.add_all(pytest.items)
+        await session.flush()
+        pytest.chart_entries = [
+            ChartEntry(
+                item=item,
+                week_id=week.id,
+                week_date=week.date,
+                rating=item.rating,
+                title=item.title.name,
+                volume=item.volume,
+                release_date=item.release_date.strftime("%d-%m-%Y"),
+                authors=[x.name for x in item.author],
+                publishers=[x.name for x in item.publisher],
+                image=item.image,
+                sold=item.sold,
+            )
+            for week, item in zip(pytest.weeks, pytest.items)
+        ]
+        session.add_all(pytest.chart_entries)
+        session.add_all(
+            WeekCalendar(
+                source_type_id=week.source_type_id,
+                year=week.date.year,
+                month=week.date.month,
+                days=[week.date.day],
+            )
+            for week in pytest.weeks
+        )
         await session.commit()
@@ -0,0 +1,110 @@
+import gzip
+import importlib.util
+import json
+from unittest import mock
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+from config.middlewares import compression_middleware
+from manga_sales.compression import compress, compress_all, negotiate_encoding
+from manga_sales.view_cache import CachedResponse, MemoryViewCache
+
+requires_brotli = pytest.mark.skipif(
+    importlib.util.find_spec("brotli") is None, reason="brotli is not installed"
+)
+BODY = json.dumps([{"title": "test_title", "rating": x} for x in range(100)])
+
+
+def request(accept_encoding: str | None = None, **headers: str) -> web.Request:
+    if accept_encoding is not None:
+        headers["Accept-Encoding"] = accept_encoding
+    return make_mocked_request("GET", "/", headers=headers)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", None),
+        ("*", "gzip"),
+        ("identity", None),
+        (None, None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    with mock.patch(
+        "manga_sales.compression.available_encodings", return_value=("gzip",)
+    ):
+        assert negotiate_encoding(request(accept_encoding)) == expected
+
+
+@requires_brotli
+def test_negotiate_encoding_brotli():
+    assert negotiate_encoding(request("gzip, br")) == "br"
+    assert negotiate_encoding(request("gzip, br;q=0")) == "gzip"
+
+
+def test_compress_gzip():
+    body = BODY.encode()
+    assert gzip.decompress(compress(body, "gzip")) == body
+    assert len(compress(body, "gzip", static=True)) < len(body)
+
+
+@requires_brotli
+def test_compress_brotli():
+    import brotli
+
+    body = BODY.encode()
+    assert brotli.decompress(compress(body, "br")) == body
+
+
+def test_cached_response_compressed():
+    cached = CachedResponse(
+        "etag",
+        "public, max-age=60",
+        "application/json",
+        BODY,
+        compress_all(BODY.encode()),
+    )
+    response = cached.to_response(request("gzip"))
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.body).decode() == BODY
+    response = cached.to_response(request())
+    assert "Content-Encoding" not in response.headers
+    assert response.text == BODY
+    assert CachedResponse.loads(cached.dumps()) == cached
+
+
+async def test_memory_cache_counts_compressed():
+    cache = MemoryViewCache(10_000)
+    cached = CachedResponse("etag", "", "application/json", BODY, {"gzip": b"12345"})
+    await cache.set("a", cached, 60)
+    assert cache.total_size == len(BODY) + 5
+
+
+async def test_compression_middleware(aiohttp_client):
+    async def handler(request):
+        body = BODY if request.query.get("size") != "small" else "[]"
+        response = web.Response(text=body, content_type="application/json")
+        response.etag = "etag"
+        return response
+
+    app = web.Application(middlewares=[compression_middleware])
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app, auto_decompress=False)
+    with mock.patch(
+        "manga_sales.compression.available_encodings", return_value=("gzip",)
+    ):
+        resp = await client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert resp.headers["ETag"] == '"etag-gzip"'
+        assert gzip.decompress(await resp.read()).decode() == BODY
+        resp = await client.get(
+            "/", params={"size": "small"}, headers={"Accept-Encoding": "gzip"}
+        )
+        assert "Content-Encoding" not in resp.headers
+        assert resp.headers["ETag"] == '"etag"'
+        resp = await client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "Content-Encoding" not in resp.headers
+        assert await resp.text() == BODY
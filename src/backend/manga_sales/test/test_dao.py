@@ -1,12 +1,14 @@
 import pytest
 from manga_sales.db.data_access_layers.author import AuthorDAO
+from manga_sales.db.data_access_layers.chart_entry import ChartEntryDAO
 from manga_sales.db.data_access_layers.item import ItemDAO
 from manga_sales.db.data_access_layers.publisher import PublisherDAO
 from manga_sales.db.data_access_layers.source import SourceDAO
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
 from manga_sales.db.data_access_layers.title import TitleDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
-from manga_sales.db.models import PreviousRank, Title
+from manga_sales.db.data_access_layers.week_calendar import WeekCalendarDAO
+from manga_sales.db.models import PreviousRank, Title, Week
 import datetime
 from manga_sales.test.conftest import *
 
@@ -53,21 +55,6 @@ class TestSourceType:
 
 @pytest.mark.usefixtures("create_data")
 class TestWeek:
-    @pytest.mark.parametrize("dao", [WeekDAO])
-    async def test_all_group_success(self, dao_session) -> None:
-        data = await dao_session.get_all_groupby(
-            pytest.sources[0].name, pytest.source_types[0].type
-        )
-        assert data == [
-            {"2021": {"August": [22]}},
-            {"2022": {"September": [11]}},
-        ]
-
-    @pytest.mark.parametrize("dao", [WeekDAO])
-    async def test_all_group_fail(self, dao_session) -> None:
-        with pytest.raises(AssertionError):
-            await dao_session.get_all_groupby(pytest.sources[0].name, "wrong")
-
     @pytest.mark.parametrize("dao", [WeekDAO])
     async def test_get_all_success(self, dao_session):
         data = await dao_session.get_all()
@@ -83,6 +70,30 @@ class TestWeek:
         data = await dao_session.get(datetime.date(2022, 9, 12))
         assert data == None
 
+    @pytest.mark.parametrize("dao", [WeekDAO])
+    async def test_get_versions(self, dao_session):
+        data = await dao_session.get_versions(
+            pytest.weeks[0].date, pytest.sources[0].name, pytest.source_types[0].type
+        )
+        assert [x.id for x in data] == [pytest.weeks[0].id]
+        # week of other source type on same date is not included
+        data2 = await dao_session.get_versions(
+            pytest.weeks[0].date, pytest.sources[1].name, pytest.source_types[1].type
+        )
+        assert data2 == []
+
+    @pytest.mark.parametrize("dao", [WeekDAO])
+    async def test_get_source_weeks(self, dao_session):
+        data = await dao_session.get_source_weeks(pytest.sources[0].name)
+        assert data == {(week.date, week.source_type_id) for week in pytest.weeks}
+
+    @pytest.mark.parametrize("dao", [WeekDAO])
+    async def test_create_if_absent_existing(self, dao_session):
+        data = await dao_session.create_if_absent(
+            pytest.weeks[0].date, pytest.source_types[0].id
+        )
+        assert data == None
+
     @pytest.mark.parametrize("dao", [WeekDAO])
     async def test_get_previous_row_success(self, dao_session):
         data = await dao_session.get_previous_week(
@@ -117,26 +128,88 @@ class TestItem:
             await dao_session.get_instance(datetime.date(2022, 9, 11))
 
     @pytest.mark.parametrize("dao", [ItemDAO])
-    async def test_get_prev_rank_succes(self, dao_session):
-        result = await dao_session.get_previous_rank(
+    async def test_get_prev_ranks(self, dao_session):
+        name = pytest.items[1].title.name
+        result = await dao_session.get_previous_ranks(
             pytest.weeks[1],
-            pytest.items[0].rating,
-            pytest.items[0].title.name,
+            [(name, 1), (name, 2), (name, 3), ("something wrong", 1)],
         )
-        assert result == PreviousRank.UP.name
+        assert result == {
+            (name, 1): PreviousRank.UP,
+            (name, 2): PreviousRank.SAME,
+            (name, 3): PreviousRank.DOWN,
+        }
 
-    @pytest.mark.parametrize("dao", [ItemDAO])
-    async def test_get_prev_rank_none(self, dao_session):
-        title = Title(name="test_none")
-        pytest.items[0].title = title
-        dao_session.session.add(title)
+
+@pytest.mark.usefixtures("create_data")
+class TestWeekCalendar:
+    @pytest.mark.parametrize("dao", [WeekCalendarDAO])
+    async def test_get_by_source(self, dao_session) -> None:
+        data = await dao_session.get_by_source(
+            pytest.sources[0].name, pytest.source_types[0].type
+        )
+        assert data == [
+            {"2021": {"August": [22]}},
+            {"2022": {"September": [11]}},
+        ]
+
+    @pytest.mark.parametrize("dao", [WeekCalendarDAO])
+    async def test_get_by_source_wrong_type(self, dao_session) -> None:
+        data = await dao_session.get_by_source(pytest.sources[0].name, "wrong")
+        assert data == []
+
+    @pytest.mark.parametrize("dao", [WeekCalendarDAO])
+    async def test_add_week(self, dao_session) -> None:
+        source_type_id = pytest.source_types[1].id
+        for day in (30, 2, 16, 2):
+            await dao_session.add_week(
+                Week(date=datetime.date(2020, 8, day), source_type_id=source_type_id)
+            )
+        await dao_session.add_week(
+            Week(date=datetime.date(2020, 9, 6), source_type_id=source_type_id)
+        )
         await dao_session.session.commit()
-        result = await dao_session.get_previous_rank(
-            pytest.weeks[1],
-            pytest.items[0].rating,
-            pytest.items[0].title.name,
+        data = await dao_session.get_by_source(
+            pytest.sources[1].name, pytest.source_types[1].type
         )
-        assert result == None
+        assert data == [{"2020": {"August": [2, 16, 30], "September": [6]}}]
+
+
+@pytest.mark.usefixtures("create_data")
+class TestChartEntry:
+    @pytest.mark.parametrize("dao", [ChartEntryDAO])
+    async def test_get_by_date(self, dao_session):
+        data = await dao_session.get_by_date("2022-09-11")
+        assert len(data) == 1
+        assert data[0].rating == 1
+        assert data[0].authors == [pytest.authors[0].name]
+        assert data[0].release_date == "11-08-2022"
+
+    @pytest.mark.parametrize("dao", [ChartEntryDAO])
+    async def test_get_by_date_empty(self, dao_session):
+        data = await dao_session.get_by_date("2022-09-12")
+        assert len(data) == 0
+
+    @pytest.mark.parametrize("dao", [ChartEntryDAO])
+    async def test_get_by_date_columns(self, dao_session):
+        data = await dao_session.get_by_date("2022-09-11", ["title", "sold"])
+        assert data[0]._fields == ("title", "sold")
+        assert data[0].title == pytest.titles[0].name
+
+    @pytest.mark.parametrize("dao", [ChartEntryDAO])
+    async def test_get_by_date_paginated(self, dao_session):
+        assert len(await dao_session.get_by_date("2022-09-11", limit=1)) == 1
+        assert len(await dao_session.get_by_date("2022-09-11", offset=1)) == 0
+        assert len(await dao_session.get_by_date("2022-09-11", after_rating=0)) == 1
+        assert len(await dao_session.get_by_date("2022-09-11", after_rating=1)) == 0
+
+    @pytest.mark.parametrize("dao", [ChartEntryDAO])
+    async def test_get_by_date_weeks(self, dao_session):
+        data = await dao_session.get_by_date(
+            "2022-09-11", week_ids=[pytest.weeks[0].id]
+        )
+        assert len(data) == 1
+        assert await dao_session.get_by_date("2022-09-11", week_ids=[]) == []
 
 
 @pytest.mark.usefixtures("create_data")
@@ -156,6 +229,15 @@ class TestAuthor:
         assert data
         assert data[0].name == pytest.authors[0].name
 
+    @pytest.mark.parametrize("dao", [AuthorDAO])
+    async def test_upsert_by_name(self, dao_session):
+        data = await dao_session.upsert_by_name(
+            ["new_author", pytest.authors[0].name, "new_author"]
+        )
+        assert [x.name for x in data] == ["new_author", pytest.authors[0].name]
+        assert data[1].id == pytest.authors[0].id
+        assert data[0].id is not None
+
 
 @pytest.mark.usefixtures("create_data")
 class TestPublisher:
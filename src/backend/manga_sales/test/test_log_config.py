@@ -0,0 +1,47 @@
+import json
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from config.config import get_postgres_uri
+from config.log_config import log_slow_queries, setup_logging
+from .conftest import test_engine
+
+
+async def test_log_slow_queries(test_engine, caplog):
+    engine = create_async_engine(get_postgres_uri(test=True), future=True)
+    log_slow_queries(engine, threshold=0.05, sample_rate=1)
+    try:
+        with caplog.at_level(logging.WARNING, logger="sql.slow_query"):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT pg_sleep(0.1)"))
+    finally:
+        await engine.dispose()
+    assert len(caplog.records) == 1
+    assert "pg_sleep" in caplog.records[0].statement
+
+
+async def test_log_slow_queries_not_sampled(test_engine, caplog):
+    engine = create_async_engine(get_postgres_uri(test=True), future=True)
+    log_slow_queries(engine, threshold=0, sample_rate=0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="sql.slow_query"):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT pg_sleep(0.01)"))
+    finally:
+        await engine.dispose()
+    assert caplog.records == []
+
+
+def test_setup_logging_production(capsys):
+    root = logging.getLogger()
+    handlers, level = root.handlers, root.level
+    try:
+        setup_logging("production")
+        logging.getLogger("test").info("message", extra={"key": 1})
+        record = json.loads(capsys.readouterr().err)
+        assert record["message"] == "message"
+        assert record["key"] == 1
+        assert record["levelname"] == "INFO"
+    finally:
+        root.handlers, root.level = handlers, level
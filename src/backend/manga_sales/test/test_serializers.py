@@ -0,0 +1,89 @@
+import datetime
+import importlib.util
+import json
+from unittest import mock
+import pytest
+from manga_sales.db.models import PreviousRank
+from manga_sales.serializers import (
+    OrjsonSerializer,
+    StdlibJSONSerializer,
+    get_serializer,
+    json_response,
+)
+
+requires_orjson = pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+)
+SERIALIZERS = [
+    StdlibJSONSerializer,
+    pytest.param(OrjsonSerializer, marks=requires_orjson),
+]
+
+
+@pytest.fixture
+def clear_serializer():
+    get_serializer.cache_clear()
+    yield
+    get_serializer.cache_clear()
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS)
+def test_dumps(serializer):
+    data = (
+        {
+            "date": datetime.date(2022, 9, 11),
+            "rank": PreviousRank.UP,
+            "rank_none": None,
+            "title": "ワンピース",
+            "days": (x for x in [1, 8]),
+        }
+        for _ in range(2)
+    )
+    result = json.loads(serializer().dumps(data))
+    assert (
+        result
+        == [
+            {
+                "date": "2022-09-11",
+                "rank": "UP",
+                "rank_none": None,
+                "title": "ワンピース",
+                "days": [1, 8],
+            }
+        ]
+        * 2
+    )
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS)
+def test_dumps_unsupported(serializer):
+    with pytest.raises(TypeError):
+        serializer().dumps({"a": object()})
+
+
+@pytest.mark.usefixtures("clear_serializer")
+@pytest.mark.parametrize(
+    "setting,expected",
+    [
+        ("json", StdlibJSONSerializer),
+        pytest.param("orjson", OrjsonSerializer, marks=requires_orjson),
+    ],
+)
+def test_get_serializer(setting, expected):
+    with mock.patch("manga_sales.serializers.JSON_SERIALIZER", setting):
+        assert isinstance(get_serializer(), expected)
+
+
+@pytest.mark.usefixtures("clear_serializer")
+def test_get_serializer_fallback():
+    with mock.patch("manga_sales.serializers.JSON_SERIALIZER", "auto"), mock.patch(
+        "manga_sales.serializers.OrjsonSerializer", side_effect=ImportError
+    ):
+        assert isinstance(get_serializer(), StdlibJSONSerializer)
+
+
+def test_json_response():
+    response = json_response([{"type": "Weekly"}])
+    assert response.content_type == "application/json"
+    assert response.charset == "utf-8"
+    assert json.loads(response.text) == [{"type": "Weekly"}]
@@ -0,0 +1,28 @@
+from unittest import mock
+from manga_sales.view_cache import CachedResponse, MemoryViewCache
+
+
+def response(body: str) -> CachedResponse:
+    return CachedResponse("etag", "public, max-age=60", "application/json", body)
+
+
+async def test_memory_cache_lru():
+    cache = MemoryViewCache(10)
+    await cache.set("a", response("aaaa"), 60)
+    await cache.set("b", response("bbbb"), 60)
+    await cache.get("a")
+    await cache.set("c", response("cccc"), 60)
+    assert await cache.get("b") is None
+    assert (await cache.get("a")).body == "aaaa"
+    assert cache.total_size == 8
+
+
+async def test_memory_cache_ttl():
+    cache = MemoryViewCache(10)
+    with mock.patch("manga_sales.view_cache.time.monotonic", return_value=100):
+        await cache.set("a", response("aaaa"), 60)
+        await cache.set("b", response("bbbb"), 0)
+    with mock.patch("manga_sales.view_cache.time.monotonic", return_value=161):
+        assert await cache.get("a") is None
+    assert await cache.get("b") is None
+    assert cache.total_size == 0
@@ -1,18 +1,26 @@
+import threading
 from unittest import mock
 import pytest
 import pytest_asyncio
 from manga_sales.containers import DatabaseContainer
-from manga_sales.db.data_access_layers.item import ItemDAO
+from manga_sales.db.data_access_layers.chart_entry import ChartEntryDAO
 
 from manga_sales.db.data_access_layers.source import SourceDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
+from manga_sales.db.data_access_layers.week_calendar import WeekCalendarDAO
 from .conftest import dao_session
+from aiohttp import web
 from config.main import create_app
+from config.middlewares import db_middleware
+from db.session import get_request_session
+from manga_sales.compression import compress_all
+from manga_sales.view_cache import MemoryViewCache, get_view_cache
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
 
 
 @pytest_asyncio.fixture
 async def app():
+    get_view_cache.cache_clear()
     app = await create_app()
     app.container = DatabaseContainer()
     yield app
@@ -33,6 +41,8 @@ async def test_source_view(main_app, app, dao_session):
         assert resp.status == 200
         text = await resp.text()
         assert all(x.name in text for x in pytest.sources)
+        resp2 = await main_app.get("/source", headers={"If-None-Match": "*"})
+        assert resp2.status == 304
 
 
 
@@ -41,19 +51,185 @@ async def test_source_view(main_app, app, dao_session):
 @pytest.mark.parametrize("dao", [WeekDAO])
 async def test_week_view(main_app, app, dao_session):
     url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}"
-    with app.container.week.override(dao_session):
+    with app.container.week.override(
+        dao_session
+    ), app.container.week_calendar.override(WeekCalendarDAO(dao_session.session)):
         resp = await main_app.get(url)
         assert resp.status == 200
         text = await resp.text()
         assert all(str(x.date.day) in text for x in pytest.weeks)
+        resp2 = await main_app.get(url, headers={"If-None-Match": resp.headers["ETag"]})
+        assert resp2.status == 304
+        resp3 = await main_app.get(url, headers={"If-None-Match": '"other"'})
+        assert resp3.status == 200
 
 
 @pytest.mark.usefixtures("create_data")
-@pytest.mark.parametrize("dao", [ItemDAO])
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
 async def test_item_view(main_app, app, dao_session):
     url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}/{pytest.weeks[0].date.strftime('%Y-%m-%d')}"
-    with app.container.item.override(dao_session):
-        resp = await main_app.get(url)
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ):
+        with mock.patch.object(
+            WeekDAO, "get_versions", autospec=True, side_effect=WeekDAO.get_versions
+        ) as get_versions:
+            resp = await main_app.get(url)
+        # version is queried once for cache key and view
+        assert get_versions.call_count == 1
         assert resp.status == 200
         text = await resp.text()
         assert pytest.titles[0].name in text
+        assert pytest.items[0].release_date.strftime("%d-%m-%Y") in text
+        assert resp.headers["Cache-Control"] == "public, max-age=604800"
+        resp2 = await main_app.get(url, headers={"If-None-Match": resp.headers["ETag"]})
+        assert resp2.status == 304
+        assert resp2.headers["ETag"] == resp.headers["ETag"]
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
+async def test_item_view_missing_week(main_app, app, dao_session):
+    url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}/2000-01-01"
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ):
+        with mock.patch.object(
+            MemoryViewCache, "set", autospec=True, wraps=MemoryViewCache.set
+        ) as cache_set:
+            resp = await main_app.get(url)
+        assert resp.status == 200
+        assert resp.headers["Cache-Control"] == "public, max-age=60"
+        # cached not longer than max-age, so week ingested later is served
+        assert cache_set.call_args.args[3] == 60
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
+async def test_item_view_other_source_type(main_app, app, dao_session):
+    # week of the date exists only for first source
+    url = f"/source/{pytest.sources[1].name.lower()}/{pytest.source_types[1].type.lower()}/{pytest.weeks[0].date.strftime('%Y-%m-%d')}"
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ):
+        resp = await main_app.get(url, params={"fields": "title"})
+        assert resp.status == 200
+        assert await resp.json() == []
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
+async def test_item_view_fields(main_app, app, dao_session):
+    url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}/{pytest.weeks[0].date.strftime('%Y-%m-%d')}"
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ):
+        resp = await main_app.get(url, params={"fields": "title,sales", "limit": 10})
+        assert resp.status == 200
+        assert await resp.json() == [
+            {"title": pytest.titles[0].name, "sales": int(pytest.items[0].sold)}
+        ]
+        full = await main_app.get(url)
+        assert full.headers["ETag"] != resp.headers["ETag"]
+        resp2 = await main_app.get(url, params={"after_rating": 1})
+        assert await resp2.json() == []
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
+@pytest.mark.parametrize(
+    "params", [{"fields": "title,wrong"}, {"fields": ""}, {"limit": "-1"}]
+)
+async def test_item_view_bad_request(main_app, app, dao_session, params):
+    url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}/{pytest.weeks[0].date.strftime('%Y-%m-%d')}"
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ):
+        resp = await main_app.get(url, params=params)
+        assert resp.status == 400
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [ChartEntryDAO])
+async def test_item_view_compressed(main_app, app, dao_session):
+    threads = []
+
+    def compress_in_thread(body):
+        threads.append(threading.current_thread())
+        return compress_all(body)
+
+    url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}/{pytest.weeks[0].date.strftime('%Y-%m-%d')}"
+    with app.container.chart_entry.override(dao_session), app.container.week.override(
+        WeekDAO(dao_session.session)
+    ), mock.patch("manga_sales.view_cache.COMPRESSION_MIN_SIZE", 0), mock.patch(
+        "manga_sales.view_cache.compress_all", side_effect=compress_in_thread
+    ) as compressed:
+        headers = {"Accept-Encoding": "gzip"}
+        resp = await main_app.get(url, headers=headers)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert pytest.titles[0].name in await resp.text()
+        etag = resp.headers["ETag"]
+        assert etag.endswith('-gzip"')
+        resp2 = await main_app.get(url, headers=headers)
+        assert resp2.headers["Content-Encoding"] == "gzip"
+        assert resp2.headers["ETag"] == etag
+        assert compressed.call_count == 1
+        # compressed outside of event loop thread
+        assert threads[0] is not threading.current_thread()
+        resp3 = await main_app.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp3.status == 304
+        assert resp3.headers["ETag"] == etag
+
+
+async def test_db_middleware(aiohttp_client, session_factory):
+    sessions = []
+
+    async def handler(request):
+        sessions.append(get_request_session())
+        return web.Response()
+
+    app = web.Application(middlewares=[db_middleware])
+    app["db_sessionmaker"] = session_factory
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+    await client.get("/")
+    await client.get("/")
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+
+
+@pytest.mark.usefixtures("create_data")
+@pytest.mark.parametrize("dao", [WeekDAO])
+async def test_week_view_cached(main_app, app, dao_session):
+    url = f"/source/{pytest.sources[0].name.lower()}/{pytest.source_types[0].type.lower()}"
+    calendar = WeekCalendarDAO(dao_session.session)
+    with mock.patch.object(
+        WeekCalendarDAO, "get_by_source", wraps=calendar.get_by_source
+    ) as groupby, app.container.week.override(
+        dao_session
+    ), app.container.week_calendar.override(calendar):
+        resp = await main_app.get(url)
+        text = await resp.text()
+        resp2 = await main_app.get(url)
+        assert resp2.status == 200
+        assert await resp2.text() == text
+        assert resp2.headers["ETag"] == resp.headers["ETag"]
+        resp3 = await main_app.get(url, headers={"If-None-Match": resp.headers["ETag"]})
+        assert resp3.status == 304
+        assert groupby.call_count == 1
+        # ingest of new week changes version, so cached response is not used
+        version = await WeekDAO(dao_session.session).get_source_type_version(
+            pytest.sources[0].name, pytest.source_types[0].type
+        )
+        with mock.patch.object(
+            WeekDAO,
+            "get_source_type_version",
+            return_value=mock.Mock(
+                count=version.count + 1, last_created_at=version.last_created_at
+            ),
+        ) as version_mock:
+            resp4 = await main_app.get(url)
+            # version is queried once for cache key and view
+            assert version_mock.call_count == 1
+        assert groupby.call_count == 2
+        assert resp4.headers["ETag"] != resp.headers["ETag"]
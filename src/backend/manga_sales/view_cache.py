@@ -0,0 +1,228 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+import base64
+from dataclasses import asdict, dataclass, field
+import functools
+import json
+import time
+from typing import Any, Awaitable, Callable
+from aiohttp import web
+from aiohttp.helpers import ETag
+from config.config import (
+    COMPRESSION_MIN_SIZE,
+    REDIS_URL,
+    VIEW_CACHE_BACKEND,
+    VIEW_CACHE_MAX_SIZE,
+    VIEW_CACHE_TTLS,
+)
+from manga_sales.compression import compress_all, negotiate_encoding
+from manga_sales.http_cache import encoded_etag, get_max_age, is_not_modified
+
+View = Callable[..., Awaitable[web.Response]]
+# builds version of data that view response depends on, receives request
+# and keyword arguments of view (e.g. injected data access layers)
+Version = Callable[..., Awaitable[str]]
+
+
+@dataclass
+class CachedResponse:
+    """Body and caching headers of successful view response. Body can be
+    stored already compressed with each available content coding"""
+
+    etag: str
+    cache_control: str
+    content_type: str
+    body: str
+    compressed: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(x) for x in self.compressed.values())
+
+    def to_response(self, request: web.Request) -> web.Response:
+        encoding = negotiate_encoding(request)
+        if encoding not in self.compressed:
+            encoding = None
+        if is_not_modified(request, self.etag):
+            response = web.Response(status=304)
+        elif encoding:
+            response = web.Response(
+                body=self.compressed[encoding],
+                content_type=self.content_type,
+                charset="utf-8",
+                headers={"Content-Encoding": encoding},
+            )
+        else:
+            response = web.Response(text=self.body, content_type=self.content_type)
+        response.etag = ETag(
+            value=encoded_etag(self.etag, encoding) if encoding else self.etag
+        )
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+    def dumps(self) -> str:
+        data = asdict(self)
+        data["compressed"] = {
+            x: base64.b64encode(body).decode() for x, body in self.compressed.items()
+        }
+        return json.dumps(data)
+
+    @classmethod
+    def loads(cls, value: str | bytes) -> CachedResponse:
+        data = json.loads(value)
+        data["compressed"] = {
+            x: base64.b64decode(body) for x, body in data.get("compressed", {}).items()
+        }
+        return cls(**data)
+
+
+class ViewCache(ABC):
+    """Abstract cache of view responses"""
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedResponse | None:
+        """Get cached response if it exists and not expired"""
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedResponse, ttl: int) -> None:
+        """Cache response for ttl seconds"""
+
+
+class MemoryViewCache(ViewCache):
+    """
+    In-process cache of view responses. When total size of cached bodies
+    exceeds max_size least recently used responses are evicted.
+    Args:
+        max_size: maximum total size of cached bodies in bytes
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self.total_size = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: CachedResponse, ttl: int) -> None:
+        if ttl <= 0 or value.size > self.max_size:
+            return
+        self._remove(key)
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.total_size += value.size
+        while self.total_size > self.max_size:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_size -= entry[1].size
+
+
+class RedisViewCache(ViewCache):
+    """
+    Cache of view responses shared by all workers through redis,
+    entries expire by their ttl.
+    Args:
+        url: redis url
+        prefix: prefix of all keys of cache
+    """
+
+    def __init__(self, url: str, prefix: str = "view_cache") -> None:
+        # redis is needed only for this backend
+        from redis import asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+        self.redis = aioredis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = await self.redis.get(f"{self.prefix}:{key}")
+        return CachedResponse.loads(value) if value else None
+
+    async def set(self, key: str, value: CachedResponse, ttl: int) -> None:
+        if ttl <= 0:
+            return
+        await self.redis.set(f"{self.prefix}:{key}", value.dumps(), ex=ttl)
+
+
+@functools.lru_cache(maxsize=None)
+def get_view_cache() -> ViewCache:
+    """Create view cache with backend defined in config.
+    Instance is shared by whole process"""
+    if VIEW_CACHE_BACKEND == "redis":
+        return RedisViewCache(REDIS_URL)
+    return MemoryViewCache(VIEW_CACHE_MAX_SIZE)
+
+
+def cache_view(route: str, version: Version | None = None) -> Callable[[View], View]:
+    """Decorator caching successful responses of view with ttl defined
+        for given route name in VIEW_CACHE_TTLS, but not longer than max-age
+        of response, so short-lived responses (e.g. of weeks that are not
+        ingested yet) don't outlive it. Responses are keyed by
+        request path with query string and version of their data, so
+        responses cached before ingest of new week are not served after it
+        by any worker, large bodies are cached together with their
+        compressed variants.
+
+    Args:
+        route (str): route name
+        version (Version | None, optional): function building version of data
+            of response, only ttl limits age of response if not given.
+            Defaults to None.
+    """
+
+    def decorator(view: View) -> View:
+        @functools.wraps(view)
+        async def wrapper(
+            request: web.Request, *args: Any, **kwargs: Any
+        ) -> web.Response:
+            cache = get_view_cache()
+            data_version = await version(request, **kwargs) if version else ""
+            key = f"{route}:{data_version}:{request.rel_url}"
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached.to_response(request)
+            response = await view(request, *args, **kwargs)
+            cache_control = response.headers.get("Cache-Control", "")
+            ttl = VIEW_CACHE_TTLS.get(route, 0)
+            max_age = get_max_age(cache_control)
+            if max_age is not None:
+                ttl = min(ttl, max_age)
+            if (
+                ttl > 0
+                and response.status == 200
+                and response.etag
+                and response.text is not None
+            ):
+                body = response.text
+                compressed: dict[str, bytes] = {}
+                if len(body) >= COMPRESSION_MIN_SIZE:
+                    # compressed once here instead of on every hit, maximal
+                    # levels are slow, so other requests are not blocked by it
+                    compressed = await asyncio.get_running_loop().run_in_executor(
+                        None, compress_all, body.encode()
+                    )
+                cached = CachedResponse(
+                    response.etag.value,
+                    cache_control,
+                    response.content_type,
+                    body,
+                    compressed,
+                )
+                await cache.set(key, cached, ttl)
+                return cached.to_response(request)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,18 +1,31 @@
-import json
+import datetime
+from typing import Any
 import aiohttp_jinja2
 from dependency_injector.wiring import Provide, inject, Closing
 from aiohttp import web
+from sqlalchemy.engine.row import Row
 
+from config.config import INDEX_MAX_AGE, WEEK_MAX_AGE
 from manga_sales.containers import DatabaseContainer
-from manga_sales.db.data_access_layers.item import ItemDAO
+from manga_sales.db.data_access_layers.chart_entry import ChartEntryDAO
 from manga_sales.db.data_access_layers.source import SourceDAO
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
+from manga_sales.db.data_access_layers.week_calendar import WeekCalendarDAO
+from manga_sales.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_cache_headers,
+)
+from manga_sales.serializers import json_response
+from manga_sales.view_cache import cache_view
 
 
 @inject
+@cache_view("source")
 async def source(
-    request: web.Request,  # pylint: disable = unused-argument
+    request: web.Request,
     service: SourceDAO = Closing[Provide[DatabaseContainer.source]],
 ) -> web.Response:
     """View for page with sources
@@ -24,7 +37,7 @@ async def source(
         dict[str, list[Row]]: json with all sources
     """
     data = await service.get_all()
-    response = [
+    response = json_response(
         {
             "name": source[1],
             "image": source[2],
@@ -33,8 +46,12 @@ async def source(
             "types": source[5],
         }
         for source in data
-    ]
-    return web.Response(text=json.dumps(response), content_type="application/json")
+    )
+    # sources have no ingest time, so etag is built from the body itself
+    etag = make_etag(response.text)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, INDEX_MAX_AGE)
+    return set_cache_headers(response, etag, INDEX_MAX_AGE)
 
 
 @inject
@@ -52,14 +69,31 @@ async def source_type(
     """
     source_name = request.match_info["source"]
     data = await service.get(source_name)
-    response = [{"type": item.type} for item in data] if data else None
-    return web.Response(text=json.dumps(response), content_type="application/json")
+    return json_response(({"type": item.type} for item in data) if data else None)
+
+
+async def source_type_version(request: web.Request, service: WeekDAO, **_: Any) -> str:
+    """Version of weeks of source type, changes with every ingested week.
+    Version is stored in request, so cache_view and view query it once"""
+    if "source_type_version" not in request:
+        source_str = request.match_info["source"]
+        source_type_str = request.match_info["type"]
+        version = await service.get_source_type_version(source_str, source_type_str)
+        request["source_type_version"] = make_etag(
+            source_str, source_type_str, version.count, version.last_created_at
+        )
+    etag: str = request["source_type_version"]
+    return etag
 
 
 @inject
+@cache_view("source_type_detail", source_type_version)
 async def source_type_detail(
     request: web.Request,
     service: WeekDAO = Closing[Provide[DatabaseContainer.week]],
+    calendar_service: WeekCalendarDAO = Closing[
+        Provide[DatabaseContainer.week_calendar]
+    ],
 ) -> web.Response:
     """View for page with weeks from given source type and source
 
@@ -69,31 +103,113 @@ async def source_type_detail(
     Returns:
         dict[str, list[Row]]: json with weeks
     """
-    source_str = request.match_info["source"]
-    source_type_str = request.match_info["type"]
-    data = await service.get_all_groupby(source_str, source_type_str)
-    formatted_data = [
+    etag = await source_type_version(request, service)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, INDEX_MAX_AGE)
+    data = await calendar_service.get_by_source(
+        request.match_info["source"], request.match_info["type"]
+    )
+    formatted_data = (
         {
             "year": year,
-            "months": [
+            "months": (
                 {"name": name, "dates": dates} for (name, dates) in months.items()
-            ],
+            ),
         }
         for item in data
         for (year, months) in item.items()
-    ]
-    return web.Response(
-        text=json.dumps(formatted_data), content_type="application/json"
     )
+    return set_cache_headers(json_response(formatted_data), etag, INDEX_MAX_AGE)
+
+
+# fields of detail response and chart entry columns they are read from
+DETAIL_FIELDS = {
+    "title": "title",
+    "rating": "rating",
+    "volume": "volume",
+    "release_date": "release_date",
+    "authors": "authors",
+    "publishers": "publishers",
+    "image": "image",
+    "sales": "sold",
+    "prev_rank": "previous_rank",
+}
+
+
+def _int_param(request: web.Request, name: str, default: int | None) -> int | None:
+    value = request.query.get(name)
+    if value is None:
+        return default
+    if not value.isdigit():
+        raise web.HTTPBadRequest(text=f"{name} must be non-negative integer")
+    return int(value)
+
+
+def parse_detail_query(
+    request: web.Request,
+) -> tuple[list[str], int | None, int, int | None]:
+    """Parse fields projection and pagination parameters of detail view
+
+    Args:
+        request (web.Request)
+
+    Raises:
+        web.HTTPBadRequest: if unknown field is requested or parameter is not integer
+
+    Returns:
+        tuple[list[str], int | None, int, int | None]: requested fields, limit,
+        offset and rating after which items are returned
+    """
+    fields = (
+        [x for x in request.query["fields"].split(",") if x]
+        if "fields" in request.query
+        else list(DETAIL_FIELDS)
+    )
+    unknown = [x for x in fields if x not in DETAIL_FIELDS]
+    if unknown or not fields:
+        raise web.HTTPBadRequest(
+            text=f"fields must be subset of {','.join(DETAIL_FIELDS)}"
+        )
+    return (
+        list(dict.fromkeys(fields)),
+        _int_param(request, "limit", None),
+        _int_param(request, "offset", None) or 0,
+        _int_param(request, "after_rating", None),
+    )
+
+
+async def get_week_versions(request: web.Request, week_service: WeekDAO) -> list[Row]:
+    """Ids and ingest times of weeks of requested date and source type.
+    Rows are stored in request, so cache_view and view query them once"""
+    if "week_versions" not in request:
+        request["week_versions"] = await week_service.get_versions(
+            datetime.datetime.strptime(request.match_info["date"], "%Y-%m-%d").date(),
+            request.match_info["source"],
+            request.match_info["type"],
+        )
+    versions: list[Row] = request["week_versions"]
+    return versions
+
+
+async def detail_version(request: web.Request, week_service: WeekDAO, **_: Any) -> str:
+    """Version of weeks of requested date built from their ids and ingest times"""
+    versions = await get_week_versions(request, week_service)
+    return make_etag(*(f"{x.id}-{x.created_at.isoformat()}" for x in versions))
 
 
 @aiohttp_jinja2.template("detail.html")
 @inject
+@cache_view("detail", detail_version)
 async def detail(
     request: web.Request,
-    service: ItemDAO = Closing[Provide[DatabaseContainer.item]],
+    service: ChartEntryDAO = Closing[Provide[DatabaseContainer.chart_entry]],
+    week_service: WeekDAO = Closing[Provide[DatabaseContainer.week]],
 ) -> web.Response:
-    """View for page with items from given week
+    """View for page with items from week of given date and source type.
+    Ingested week never changes, so response is cached for long time and
+    revalidated with ETag built from ids and ingest times of weeks. Items can
+    be paginated with limit and offset or after_rating query parameters,
+    fields parameter selects comma separated fields of items.
 
     Args:
         request (web.Request)
@@ -102,23 +218,23 @@ async def detail(
         dict[str, list[Row]]: items
     """
     date = request.match_info["date"]
-    data = await service.get_instance(date)
-    formatted_data = [
-        {
-            "title": item.title,
-            "rating": item.rating,
-            "volume": item.volume,
-            "release_date": item.release_date.strftime("%d-%m-%Y")
-            if item.release_date
-            else None,
-            "authors": item.authors,
-            "publishers": item.publishers,
-            "image": item.image,
-            "sales": item.sold,
-            "prev_rank": item.previous_rank.name if item.previous_rank else None,
-        }
-        for item in data
-    ]
-    return web.Response(
-        text=json.dumps(formatted_data), content_type="application/json"
+    fields, limit, offset, after_rating = parse_detail_query(request)
+    versions = await get_week_versions(request, week_service)
+    etag = make_etag(
+        date,
+        request.query_string,
+        *(f"{x.id}-{x.created_at.isoformat()}" for x in versions),
+    )
+    max_age = WEEK_MAX_AGE if versions else INDEX_MAX_AGE
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age)
+    data = await service.get_by_date(
+        date,
+        [DETAIL_FIELDS[x] for x in fields],
+        limit=limit,
+        offset=offset,
+        after_rating=after_rating,
+        week_ids=[x.id for x in versions],
     )
+    formatted_data = (dict(zip(fields, row)) for row in data)
+    return set_cache_headers(json_response(formatted_data), etag, max_age)
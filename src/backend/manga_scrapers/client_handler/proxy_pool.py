@@ -0,0 +1,168 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Collection, Iterable
+from urllib.parse import urlparse
+from manga_scrapers.exceptions import ConnectError
+
+SUCCESS = "success"
+ERROR = "error"
+THROTTLED = "throttled"
+
+
+@dataclass
+class ProxyStats:
+    """Outcomes of requests sent through proxy in rolling time window.
+    None proxy means direct connection"""
+
+    proxy: str | None
+    window: float
+    outcomes: deque[tuple[float, str, float]] = field(default_factory=deque)
+    consecutive_errors: int = 0
+    quarantined_until: float = 0
+
+    def record(self, outcome: str, latency: float = 0) -> None:
+        self.outcomes.append((time.monotonic(), outcome, latency))
+        self._prune()
+
+    def _prune(self) -> None:
+        threshold = time.monotonic() - self.window
+        while self.outcomes and self.outcomes[0][0] < threshold:
+            self.outcomes.popleft()
+
+    def _rate(self, outcome: str) -> float:
+        self._prune()
+        if not self.outcomes:
+            return 0
+        return sum(1 for x in self.outcomes if x[1] == outcome) / len(self.outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        return self._rate(ERROR)
+
+    @property
+    def throttle_rate(self) -> float:
+        return self._rate(THROTTLED)
+
+    @property
+    def latency(self) -> float:
+        """Mean latency of successful requests in seconds"""
+        self._prune()
+        latencies = [x[2] for x in self.outcomes if x[1] == SUCCESS]
+        return sum(latencies) / len(latencies) if latencies else 0
+
+    @property
+    def score(self) -> float:
+        """Health of proxy, the higher the more often proxy is chosen"""
+        health = (1 - self.error_rate) * (1 - self.throttle_rate) / (1 + self.latency)
+        # proxies with all requests failed still get a small chance
+        return max(health, 0.01)
+
+    def is_quarantined(self) -> bool:
+        return self.quarantined_until > time.monotonic()
+
+    @property
+    def name(self) -> str:
+        """Proxy address without credentials"""
+        if self.proxy is None:
+            return "direct"
+        url = urlparse(self.proxy)
+        return f"{url.hostname}:{url.port}" if url.hostname else self.proxy
+
+
+class ProxyPool:
+    """
+    Pool of proxies that chooses proxy weighted by its health. Health is based
+    on latency, error and 429 rates in rolling window. Proxy is quarantined
+    after error for time that grows exponentially with consecutive errors.
+    Args:
+        proxies: list of proxy urls, None for direct connection
+        window: rolling window of stats in seconds
+        quarantine: quarantine time in seconds after first error
+        max_quarantine: maximal quarantine time in seconds
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str | None],
+        window: float = 600,
+        quarantine: float = 30,
+        max_quarantine: float = 30 * 60,
+    ) -> None:
+        self.window = window
+        self.quarantine = quarantine
+        self.max_quarantine = max_quarantine
+        self.proxies: dict[str | None, ProxyStats] = {}
+        self.update(proxies)
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def update(self, proxies: Iterable[str | None]) -> None:
+        """Replace proxies of pool keeping stats of the ones that remain"""
+        self.proxies = {
+            proxy: self.proxies.get(proxy) or ProxyStats(proxy, self.window)
+            for proxy in proxies
+        }
+
+    def choose(self, exclude: Collection[str | None] = ()) -> str | None:
+        """Choose proxy randomly weighted by health. If all proxies are
+            quarantined the one with the earliest end of quarantine is chosen.
+
+        Args:
+            exclude (Collection[str | None], optional): proxies that must not
+                be chosen, e.g. already failed for current request. Defaults to ().
+
+        Raises:
+            ConnectError: if all proxies are excluded
+
+        Returns:
+            str | None: proxy url or None for direct connection
+        """
+        candidates = [x for x in self.proxies.values() if x.proxy not in exclude]
+        if not candidates:
+            raise ConnectError("Failed to connect, perhabs due to invalid proxies")
+        healthy = [x for x in candidates if not x.is_quarantined()]
+        if not healthy:
+            return min(candidates, key=lambda x: x.quarantined_until).proxy
+        return random.choices(healthy, weights=[x.score for x in healthy])[0].proxy
+
+    def record_success(self, proxy: str | None, latency: float) -> None:
+        stats = self.proxies.get(proxy)
+        if stats is None:
+            return
+        stats.record(SUCCESS, latency)
+        stats.consecutive_errors = 0
+        stats.quarantined_until = 0
+
+    def record_throttled(self, proxy: str | None) -> None:
+        stats = self.proxies.get(proxy)
+        if stats is not None:
+            stats.record(THROTTLED)
+
+    def record_error(self, proxy: str | None) -> None:
+        stats = self.proxies.get(proxy)
+        if stats is None:
+            return
+        stats.record(ERROR)
+        stats.consecutive_errors += 1
+        quarantine = min(
+            self.quarantine * 2 ** (stats.consecutive_errors - 1), self.max_quarantine
+        )
+        stats.quarantined_until = time.monotonic() + quarantine
+
+    def stats(self) -> dict[str, dict[str, float | bool]]:
+        """Current stats of all proxies keyed by proxy address without credentials"""
+        return {
+            x.name: {
+                "latency": x.latency,
+                "error_rate": x.error_rate,
+                "throttle_rate": x.throttle_rate,
+                "score": x.score,
+                "quarantined": x.is_quarantined(),
+                "requests": len(x.outcomes),
+            }
+            for x in self.proxies.values()
+        }
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import asyncio
+import functools
+import logging
+import time
+from typing import Any
+import aiohttp
+from config.config import PROXY_LIST_RETRY, PROXY_LIST_TTL, PROXY_URL
+
+logger = logging.getLogger(__name__)
+
+
+def parse_proxies(content: dict[str, Any] | None) -> list[str | None]:
+    """Get proxy urls from proxy6 getproxy response, None for direct connection
+    is always included"""
+    proxy_list: list[str | None] = [None]
+    if content:
+        for proxy_data in content["list"].values():
+            proxy_list.append(
+                f"http://{proxy_data['user']}:{proxy_data['pass']}@{proxy_data['host']}:{proxy_data['port']}"
+            )
+    return proxy_list
+
+
+class ProxyRegistry:
+    """
+    List of proxies shared by all sessions of process. List is refreshed
+    in background when it is older than ttl, so getting it never waits
+    for proxy API. Until first refresh only direct connection is available,
+    if refresh fails last known list is kept and refresh is retried later.
+    Args:
+        url: proxy API url
+        ttl: time in seconds after which list is refreshed
+        retry: time in seconds after which failed refresh is retried
+        timeout: timeout of request to proxy API in seconds
+    """
+
+    def __init__(self, url: str, ttl: float, retry: float, timeout: float = 30) -> None:
+        self.url = url
+        self.ttl = ttl
+        self.retry = retry
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.proxies: list[str | None] = [None]
+        # incremented on every successful refresh
+        self.version = 0
+        self.refresh_at = 0.0
+        self.task: asyncio.Task[None] | None = None
+
+    def get(self) -> list[str | None]:
+        """Get last known list of proxies and start its refresh if it's stale"""
+        if self.task is None and time.monotonic() >= self.refresh_at:
+            self.task = asyncio.create_task(self.refresh())
+        return self.proxies
+
+    async def refresh(self) -> None:
+        try:
+            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+                async with session.get(
+                    f"{self.url}/getproxy", raise_for_status=True
+                ) as response:
+                    proxies = parse_proxies(await response.json())
+        except Exception as error:  # pylint: disable = broad-except
+            # any failure, e.g. non json body or malformed payload, must not
+            # stop refreshes, otherwise list would be requested on every get
+            logger.warning("Failed to refresh proxy list: %r", error)
+            self.refresh_at = time.monotonic() + self.retry
+        else:
+            self.proxies = proxies
+            self.version += 1
+            self.refresh_at = time.monotonic() + self.ttl
+        finally:
+            self.task = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_proxy_registry() -> ProxyRegistry:
+    """Create proxy registry of proxy API defined in config.
+    Instance is shared by whole process"""
+    return ProxyRegistry(PROXY_URL, PROXY_LIST_TTL, PROXY_LIST_RETRY)
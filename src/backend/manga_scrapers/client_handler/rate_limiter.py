@@ -0,0 +1,138 @@
+from __future__ import annotations
+import asyncio
+import datetime
+from email.utils import parsedate_to_datetime
+import functools
+import time
+from urllib.parse import urlparse
+from config.config import SCRAPER_HOST_RATES, SCRAPER_RATE
+
+
+class TokenBucket:
+    """
+    Token bucket allowing rate requests per second with bursts up to capacity.
+    Rate is halved on every 429 response and restored gradually with
+    successful responses.
+    Args:
+        rate: maximal number of requests per second
+        capacity: maximal burst of requests
+        min_rate: rate is not lowered below this value
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.05) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min(min_rate, rate)
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        # tokens are not refilled while requests are blocked
+        if now > self.updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def reserve(self) -> float:
+        """Take token and return time in seconds to wait before request.
+        Tokens can go negative, so concurrent callers are queued one after
+        another, callers queued during block are spaced by rate after its end"""
+        now = time.monotonic()
+        start = max(now, self.blocked_until)
+        self._refill(start)
+        self.tokens -= 1
+        return start - now + max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def slow_down(self, retry_after: float | None = None) -> None:
+        """Halve rate and block requests for retry_after seconds if given"""
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        if retry_after is not None:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            # only single request is allowed right after block ends
+            self.tokens = min(self.tokens, 1)
+            self.updated = max(self.updated, self.blocked_until)
+
+    def speed_up(self) -> None:
+        """Restore rate by tenth of maximal rate"""
+        if self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class RateLimiter:
+    """
+    Per-host token buckets. Host budget applies to the host itself
+    and its subdomains (e.g. "amazon.co.jp" limits "www.amazon.co.jp").
+    Args:
+        default_rate: requests per second for hosts without own budget
+        host_rates: requests per second for given hosts
+    """
+
+    def __init__(
+        self, default_rate: float, host_rates: dict[str, float] | None = None
+    ) -> None:
+        self.default_rate = default_rate
+        self.host_rates = host_rates or {}
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def _budget_key(self, url: str) -> tuple[str, float]:
+        host = urlparse(url).hostname or ""
+        for budget_host, rate in self.host_rates.items():
+            if host == budget_host or host.endswith(f".{budget_host}"):
+                return budget_host, rate
+        return host, self.default_rate
+
+    def bucket(self, url: str) -> TokenBucket:
+        key, rate = self._budget_key(url)
+        if key not in self.buckets:
+            self.buckets[key] = TokenBucket(rate, max(1.0, rate))
+        return self.buckets[key]
+
+    async def acquire(self, url: str) -> None:
+        """Wait until request to url is allowed"""
+        await self.bucket(url).acquire()
+
+    def throttled(self, url: str, retry_after: str | None = None) -> None:
+        """Slow down requests to host of url after 429 response
+
+        Args:
+            url (str): requested url
+            retry_after (str | None, optional): value of Retry-After header,
+                either seconds or http date. Defaults to None.
+        """
+        self.bucket(url).slow_down(parse_retry_after(retry_after))
+
+    def succeeded(self, url: str) -> None:
+        self.bucket(url).speed_up()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Get number of seconds from Retry-After header value"""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(
+        0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_rate_limiter() -> RateLimiter:
+    """Create rate limiter with budgets defined in config. Instance is shared
+    by all sessions of process so that budgets hold for all scrapers together"""
+    return RateLimiter(SCRAPER_RATE, SCRAPER_HOST_RATES)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import functools
+import hashlib
+import json
+from pathlib import Path
+import time
+from urllib.parse import urlparse
+from config.config import (
+    SCRAPER_CACHE_DIR,
+    SCRAPER_CACHE_HOST_TTLS,
+    SCRAPER_CACHE_MAX_SIZE,
+    SCRAPER_CACHE_TTL,
+)
+
+
+@dataclass
+class CacheEntry:
+    """Metadata of cached response, body is stored in separate file"""
+
+    url: str
+    stored_at: float
+    size: int
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """
+    On-disk cache of response bodies keyed by url.
+    Entries are fresh for ttl seconds of their host, after that they
+    can be revalidated with ETag/Last-Modified headers. When total size of
+    cached bodies exceeds max_size least recently used entries are evicted.
+    Args:
+        path: directory where cached responses are stored
+        max_size: maximum total size of cached bodies in bytes
+        default_ttl: time to live in seconds for hosts not given in host_ttls
+        host_ttls: time to live in seconds for given hosts
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int,
+        default_ttl: int,
+        host_ttls: dict[str, int] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.host_ttls = host_ttls or {}
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.total_size = 0
+        self._load_index()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.path / f"{key}.body"
+
+    def _load_index(self) -> None:
+        """Restore entries from disk ordered by last access time"""
+        found = []
+        for meta_path in self.path.glob("*.json"):
+            body_path = self._body_path(meta_path.stem)
+            try:
+                entry = CacheEntry(**json.loads(meta_path.read_text()))
+                accessed = body_path.stat().st_mtime
+            except (OSError, TypeError, ValueError):
+                meta_path.unlink(missing_ok=True)
+                body_path.unlink(missing_ok=True)
+                continue
+            found.append((accessed, meta_path.stem, entry))
+        for _, key, entry in sorted(found, key=lambda x: x[0]):
+            self.entries[key] = entry
+            self.total_size += entry.size
+
+    def ttl(self, url: str) -> int:
+        return self.host_ttls.get(urlparse(url).hostname or "", self.default_ttl)
+
+    def get(self, url: str) -> tuple[CacheEntry, bytes] | None:
+        """Get cached entry and body for url regardless of its freshness
+
+        Args:
+            url (str): requested url
+
+        Returns:
+            tuple[CacheEntry, bytes] | None: entry with body if cached else None
+        """
+        key = self._key(url)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        body_path = self._body_path(key)
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            self._remove(key)
+            return None
+        self.entries.move_to_end(key)
+        body_path.touch()
+        return entry, body
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl(entry.url)
+
+    @staticmethod
+    def validators(entry: CacheEntry) -> dict[str, str]:
+        """Headers for conditional request revalidating given entry"""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """Mark entry as fresh after successful revalidation"""
+        entry.stored_at = time.time()
+        self._meta_path(self._key(entry.url)).write_text(json.dumps(asdict(entry)))
+
+    def set(
+        self,
+        url: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store response body for url and evict least recently used entries
+            if cache size limit is exceeded
+
+        Args:
+            url (str): requested url
+            body (bytes): response body
+            etag (str | None, optional): ETag header of response. Defaults to None.
+            last_modified (str | None, optional): Last-Modified header of response.
+                Defaults to None.
+        """
+        if len(body) > self.max_size:
+            return
+        key = self._key(url)
+        self._remove(key)
+        entry = CacheEntry(url, time.time(), len(body), etag, last_modified)
+        self._body_path(key).write_bytes(body)
+        self._meta_path(key).write_text(json.dumps(asdict(entry)))
+        self.entries[key] = entry
+        self.total_size += entry.size
+        while self.total_size > self.max_size:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_size -= entry.size
+        self._meta_path(key).unlink(missing_ok=True)
+        self._body_path(key).unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache() -> ResponseCache | None:
+    """Create response cache defined in config, cache is disabled
+    if SCRAPER_CACHE_DIR is not set. Instance is shared by all sessions
+    of process so that size limit is enforced over whole directory"""
+    if not SCRAPER_CACHE_DIR:
+        return None
+    return ResponseCache(
+        SCRAPER_CACHE_DIR,
+        SCRAPER_CACHE_MAX_SIZE,
+        SCRAPER_CACHE_TTL,
+        SCRAPER_CACHE_HOST_TTLS,
+    )
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import random
+import aiohttp
+from config.config import (
+    SCRAPER_RETRY_ATTEMPTS,
+    SCRAPER_RETRY_BACKOFF,
+    SCRAPER_RETRY_BUDGET,
+    SCRAPER_RETRY_MAX_BACKOFF,
+    SCRAPER_RETRY_STATUSES,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Which failures of request are retried and how long to wait between attempts.
+    Args:
+        max_attempts: maximal number of attempts of single request
+        budget: maximal time in seconds spent on single request, no new
+            attempt is started if backoff would exceed it
+        backoff: base of exponential backoff in seconds
+        max_backoff: maximal backoff in seconds
+        retry_statuses: response statuses that are retried
+        retry_exceptions: exceptions that are retried
+    """
+
+    max_attempts: int = SCRAPER_RETRY_ATTEMPTS
+    budget: float = SCRAPER_RETRY_BUDGET
+    backoff: float = SCRAPER_RETRY_BACKOFF
+    max_backoff: float = SCRAPER_RETRY_MAX_BACKOFF
+    retry_statuses: frozenset[int] = frozenset(SCRAPER_RETRY_STATUSES)
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+    )
+
+    def delay(self, attempt: int) -> float:
+        """Backoff with full jitter after given attempt, so that requests
+        failed together are not retried together"""
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+
+
+@dataclass
+class Attempt:
+    """Single attempt of request, either status or error is set"""
+
+    url: str
+    number: int
+    proxy: str | None
+    latency: float
+    status: int | None = None
+    error: BaseException | None = None
+
+    @property
+    def outcome(self) -> str:
+        return str(self.status) if self.error is None else type(self.error).__name__
+
+
+@dataclass
+class AttemptStats:
+    """Counts of attempts by outcome and of retried and failed requests"""
+
+    outcomes: Counter[str] = field(default_factory=Counter)
+    attempts: int = 0
+    retried: int = 0
+    exhausted: int = 0
+
+    def record(self, attempt: Attempt) -> None:
+        self.attempts += 1
+        self.outcomes[attempt.outcome] += 1
+        if attempt.number == 2:
+            self.retried += 1
+
+    def as_dict(self) -> dict[str, int | dict[str, int]]:
+        return {
+            "attempts": self.attempts,
+            "retried": self.retried,
+            "exhausted": self.exhausted,
+            "outcomes": dict(self.outcomes),
+        }
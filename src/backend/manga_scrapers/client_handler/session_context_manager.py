@@ -1,10 +1,28 @@
 from __future__ import annotations
-import random
+import logging
+import time
 from types import TracebackType
 from typing import Any
 import asyncio
 import aiohttp
-from config.config import PROXY_URL
+from config.config import (
+    PROXY_MAX_QUARANTINE,
+    PROXY_QUARANTINE,
+    PROXY_STATS_WINDOW,
+    SCRAPER_CONNECTIONS,
+    SCRAPER_CONNECTIONS_PER_HOST,
+    SCRAPER_DNS_TTL,
+    SCRAPER_KEEPALIVE_TIMEOUT,
+)
+from manga_scrapers.client_handler.proxy_pool import ProxyPool
+from manga_scrapers.client_handler.proxy_registry import ProxyRegistry
+from manga_scrapers.client_handler.rate_limiter import RateLimiter
+from manga_scrapers.client_handler.retry_policy import (
+    Attempt,
+    AttemptStats,
+    RetryPolicy,
+)
+from manga_scrapers.client_handler.response_cache import CacheEntry, ResponseCache
 from manga_scrapers.exceptions import (
     ConnectError,
     IncorrectMethod,
@@ -12,8 +30,6 @@ from manga_scrapers.exceptions import (
     Unsuccessful,
 )
 
-MAX_CONCURRENCY = 15
-MAX_CONCURRENCY_PER_HOST = 5
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:98.0) Gecko/20100101 Firefox/98.0",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
@@ -27,37 +43,74 @@ HEADERS = {
     "Sec-Fetch-User": "?1",
     "Cache-Control": "max-age=0",
 }
+# commands which result is whole response body, only such responses are cached
+CACHEABLE_COMMANDS = (["read"], ["content", "read"])
+
+logger = logging.getLogger(__name__)
+
+
+def create_connector() -> aiohttp.TCPConnector:
+    """Create connection pool with limits and keep-alive settings from config"""
+    return aiohttp.TCPConnector(
+        limit=SCRAPER_CONNECTIONS,
+        limit_per_host=SCRAPER_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=SCRAPER_DNS_TTL,
+        keepalive_timeout=SCRAPER_KEEPALIVE_TIMEOUT,
+    )
 
 
 class Session:
     """
     Object for connect to aiohttp ClientSession and handle context manager
     Args:
-        sleep_time: Sets sleep time in case of error 429 for too many requests.
         timeout: Set timeout for ClientTimeout class.
         headers: Set headers or can be omitted and defalt headers defined
         in class will be used.
+        cache: Response cache for bodies of successful responses,
+        caching is disabled if omitted.
+        rate_limiter: Per-host limiter of request rate, which is lowered
+        on 429 responses, rate is not limited if omitted.
+        retry_policy: Policy of retrying failed requests, policy with
+        settings from config is used if omitted.
+        proxy_registry: Source of proxies, only direct connection
+        is used if omitted.
+        connector: Connection pool shared with other sessions, it's not
+        closed with session. Session creates and owns its own pool if omitted.
     """
 
     def __init__(
         self,
         timeout: int | None = 360,
         headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        proxy_registry: ProxyRegistry | None = None,
+        connector: aiohttp.BaseConnector | None = None,
     ) -> None:
-        self.connector = aiohttp.TCPConnector(
-            limit=MAX_CONCURRENCY, limit_per_host=MAX_CONCURRENCY_PER_HOST
-        )
+        self.connector_owner = connector is None
+        self.connector = connector or create_connector()
         self.session: aiohttp.ClientSession
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.headers = headers or HEADERS
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.attempts = AttemptStats()
+        self.proxy_registry = proxy_registry
+        self.proxy_version = -1
+        self.proxies = ProxyPool(
+            [None], PROXY_STATS_WINDOW, PROXY_QUARANTINE, PROXY_MAX_QUARANTINE
+        )
 
     async def __aenter__(self) -> Session:
         self.session = aiohttp.ClientSession(
             headers=self.headers,
             timeout=self.timeout,
             connector=self.connector,
+            connector_owner=self.connector_owner,
         )
-        self.proxy_list = await self.get_proxy()
+        self._sync_proxies()
         return self
 
     async def __aexit__(
@@ -66,33 +119,23 @@ class Session:
         exc_val: type[BaseException],
         exc_tb: type[TracebackType],
     ) -> None:
+        logger.info("Proxy stats: %s", self.proxy_stats())
+        logger.info("Request stats: %s", self.attempts.as_dict())
         await self.session.close()
 
-    def choose_proxy(self) -> int:
-        return random.randint(0, len(self.proxy_list) - 1)
-
-    def rotate_proxy(self, proxy_index: int, initial_index: int) -> int:
-        proxy_index = (proxy_index + 1) % len(self.proxy_list)
-        if proxy_index == initial_index:
-            raise ConnectError("Failed to connect, perhabs due to invalid proxies")
-        return proxy_index
+    def proxy_stats(self) -> dict[str, dict[str, float | bool]]:
+        """Latency, error and 429 rates, health score and quarantine state
+        of each proxy"""
+        return self.proxies.stats()
 
-    async def get_proxy(self) -> list[str | None]:
-        proxy_list: list[str | None] = [None]
-        try:
-            async with self.session.get(f"{PROXY_URL}/getproxy") as response:
-                content = await response.json()
-                if content:
-                    proxy_names = content["list"].keys()
-                    for name in proxy_names:
-                        proxy_data = content["list"][name]
-                        proxy_list.append(
-                            f"http://{proxy_data['user']}:{proxy_data['pass']}@{proxy_data['host']}:{proxy_data['port']}"
-                        )
-                return proxy_list
-        except aiohttp.ClientResponseError:
-            await asyncio.sleep(1)
-            return await self.get_proxy()
+    def _sync_proxies(self) -> None:
+        """Update proxy pool if registry got new list of proxies"""
+        if self.proxy_registry is None:
+            return
+        proxies = self.proxy_registry.get()
+        if self.proxy_registry.version != self.proxy_version:
+            self.proxies.update(proxies)
+            self.proxy_version = self.proxy_registry.version
 
     @staticmethod
     async def _apply_commands(
@@ -111,59 +154,136 @@ class Session:
                 ) from error
         return response
 
+    def _choose_proxy(self, tried: set[str | None]) -> str | None:
+        """Choose proxy not tried yet for current request, when all proxies
+        were tried they are chosen again by their health"""
+        try:
+            return self.proxies.choose(exclude=tried)
+        except ConnectError:
+            tried.clear()
+            return self.proxies.choose()
+
+    def _record_response(
+        self,
+        url: str,
+        proxy: str | None,
+        response: aiohttp.ClientResponse,
+        latency: float,
+    ) -> None:
+        if response.status == 429:
+            self.proxies.record_throttled(proxy)
+        elif response.status in self.retry_policy.retry_statuses:
+            self.proxies.record_error(proxy)
+        else:
+            self.proxies.record_success(proxy, latency)
+        if self.rate_limiter is not None:
+            if response.status == 429:
+                self.rate_limiter.throttled(url, response.headers.get("Retry-After"))
+            elif response.status < 500:
+                self.rate_limiter.succeeded(url)
+
+    async def _attempt(
+        self,
+        url: str,
+        proxy: str | None,
+        commands: list[str] | None,
+        cached: tuple[CacheEntry, bytes] | None,
+    ) -> tuple[int, Any]:
+        """Send single request. Returns status of response with result of commands,
+        result is None if status should be retried"""
+        start = time.monotonic()
+        async with self.session.get(
+            url,
+            proxy=proxy,
+            headers=ResponseCache.validators(cached[0]) if cached else None,
+        ) as response:
+            self._record_response(url, proxy, response, time.monotonic() - start)
+            if response.status == 200:
+                if self.cache is not None and commands in CACHEABLE_COMMANDS:
+                    body = await response.read()
+                    self.cache.set(
+                        url,
+                        body,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+                    return response.status, body
+                if commands:
+                    return response.status, await self._apply_commands(
+                        response, commands
+                    )
+                return response.status, response
+            if response.status == 304 and cached and self.cache is not None:
+                self.cache.refresh(cached[0])
+                return response.status, cached[1]
+            if response.status == 404:
+                raise NotFound("Can't find given page")
+            if response.status in self.retry_policy.retry_statuses:
+                return response.status, None
+            raise Unsuccessful(f"Status code is {response.status}")
+
     async def _get(
         self,
         url: str,
-        proxy_index: int,
-        initial_index: int,
         commands: list[str] | None = None,
-        sleep_time: int | None = None,
+        cached: tuple[CacheEntry, bytes] | None = None,
     ) -> Any:
-        try:
-            async with self.session.get(
-                url, proxy=self.proxy_list[proxy_index]
-            ) as response:
-                if response.status == 200:
-                    if commands:
-                        response = await self._apply_commands(response, commands)
-                    return response
-                if response.status == 404:
-                    raise NotFound("Can't find given page")
-                if response.status == 429:
-                    print(f"{url} - {sleep_time} = {response.status}")
-                    if not sleep_time:
-                        sleep_time = 1
-                    await asyncio.sleep(sleep_time)
-                    sleep_time += 1
-                    return await self.fetch(url, commands, sleep_time)
-                if response.status == 503:
-                    self.rotate_proxy(proxy_index, initial_index)
-                    return await self._get(
-                        url, proxy_index, initial_index, commands, sleep_time
-                    )
-                raise Unsuccessful(f"Status code is {response.status}")
-        except (aiohttp.ClientError, asyncio.TimeoutError):
-            self.rotate_proxy(proxy_index, initial_index)
-            return await self._get(
-                url, proxy_index, initial_index, commands, sleep_time
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.budget
+        tried: set[str | None] = set()
+        self._sync_proxies()
+        for number in range(1, policy.max_attempts + 1):
+            proxy = self._choose_proxy(tried)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(url)
+            start = time.monotonic()
+            status, result, error = None, None, None
+            try:
+                status, result = await self._attempt(url, proxy, commands, cached)
+            except (
+                policy.retry_exceptions
+            ) as exc:  # pylint: disable=catching-non-exception
+                self.proxies.record_error(proxy)
+                error = exc
+            attempt = Attempt(
+                url, number, proxy, time.monotonic() - start, status, error
             )
+            self.attempts.record(attempt)
+            logger.debug("Attempt %s of %s: %s", number, url, attempt.outcome)
+            if error is None and status not in policy.retry_statuses:
+                return result
+            if status != 429:
+                # throttling is caused by host, not by proxy
+                tried.add(proxy)
+            delay = policy.delay(number)
+            if number == policy.max_attempts or time.monotonic() + delay > deadline:
+                break
+            await asyncio.sleep(delay)
+        self.attempts.exhausted += 1
+        logger.warning("Request to %s failed after %s attempts", url, number)
+        if status is not None and status != 503:
+            raise Unsuccessful(f"Status code is {status}")
+        raise ConnectError(
+            f"Failed to connect to {url}, perhabs due to invalid proxies"
+        ) from error
 
-    async def fetch(
-        self, url: str, commands: list[str] | None = None, sleep_time: int | None = None
-    ) -> Any:
+    async def fetch(self, url: str, commands: list[str] | None = None) -> Any:
         """
         Method for handling requests/responses
         Args:
             url: Url to which the request should be sent
-            retries: Set how many times we can get a 429 error (default 5)
-                        after which we will raise the error.
             commands: set list for the command that is invoked on the response
             object. For example, ['content','read']
                 would be called on the response as follows -
                 response.content.read(). Can be omitted
                 and then method returns just response object.
+                If session has cache and commands return whole body
+                (['read'] or ['content','read']) fresh cached body is
+                returned without request and stale one is revalidated.
         """
-        if sleep_time:
-            await asyncio.sleep(sleep_time)
-        proxy_index = initial_index = self.choose_proxy()
-        return await self._get(url, proxy_index, initial_index, commands, sleep_time)
+        cached = None
+        if self.cache is not None and commands in CACHEABLE_COMMANDS:
+            cached = self.cache.get(url)
+            if cached and self.cache.is_fresh(cached[0]):
+                return cached[1]
+        return await self._get(url, commands, cached)
@@ -0,0 +1,30 @@
+import aiohttp
+from dependency_injector import containers, providers
+from manga_scrapers.services.session_service import (
+    connector_factory,
+    session_factory,
+)
+from manga_scrapers.client_handler.session_context_manager import Session
+from manga_scrapers.client_handler.proxy_registry import get_proxy_registry
+from manga_scrapers.client_handler.rate_limiter import get_rate_limiter
+from manga_scrapers.client_handler.response_cache import get_response_cache
+
+
+class ClientContainer(containers.DeclarativeContainer):
+    """Container for http client. Single instance is shared by all scraping
+    containers, so that scrapers use one connection pool with common limits"""
+
+    response_cache = providers.Callable(get_response_cache)
+    rate_limiter = providers.Callable(get_rate_limiter)
+    proxy_registry = providers.Callable(get_proxy_registry)
+    connector: providers.Resource[aiohttp.TCPConnector] = providers.Resource(
+        connector_factory
+    )
+    web_session: providers.Resource[Session] = providers.Resource(
+        session_factory,
+        Session,
+        cache=response_cache,
+        rate_limiter=rate_limiter,
+        proxy_registry=proxy_registry,
+        connector=connector,
+    )
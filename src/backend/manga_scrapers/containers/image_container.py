@@ -1,7 +1,6 @@
 from dependency_injector import containers, providers
 from manga_scrapers.scrapers.image_scrapers.cdjapan import CDJapanImageScraper
-from manga_scrapers.services.session_service import session_factory
-from manga_scrapers.client_handler.session_context_manager import Session
+from manga_scrapers.containers.client_container import ClientContainer
 
 
 class ImageScrapingContainer(containers.DeclarativeContainer):
@@ -14,10 +13,8 @@ class ImageScrapingContainer(containers.DeclarativeContainer):
             "manga_scrapers.services.db_service",
         ]
     )
-    web_session: providers.Resource[Session] = providers.Resource(
-        session_factory, Session
-    )
+    client = providers.Container(ClientContainer)
     cdjapan_scraper = providers.Factory(
         CDJapanImageScraper,
-        session=web_session,
+        session=client.web_session,
     )
@@ -5,8 +5,7 @@ from manga_scrapers.scrapers.rating_scrapers.oricon_scraper import (
 from manga_scrapers.scrapers.rating_scrapers.shoseki_scraper import (
     ShosekiWeeklyScraper,
 )
-from manga_scrapers.services.session_service import session_factory
-from manga_scrapers.client_handler.session_context_manager import Session
+from manga_scrapers.containers.client_container import ClientContainer
 
 
 class DataScrapingContainer(containers.DeclarativeContainer):
@@ -19,11 +18,11 @@ class DataScrapingContainer(containers.DeclarativeContainer):
             "manga_scrapers.test.test_db_handler",
         ]
     )
-    web_session: providers.Resource[Session] = providers.Resource(
-        session_factory, Session
-    )
+    client = providers.Container(ClientContainer)
     oricon_scraper = providers.Factory(
         OriconWeeklyScraper,
-        session=web_session,
+        session=client.web_session,
+    )
+    shoseki_scraper = providers.Factory(
+        ShosekiWeeklyScraper, session=client.web_session
     )
-    shoseki_scraper = providers.Factory(ShosekiWeeklyScraper, session=web_session)
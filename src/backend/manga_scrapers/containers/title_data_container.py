@@ -3,8 +3,9 @@ from manga_scrapers.scrapers.title_data_scrapers.amazon_scraper import AmazonPar
 from manga_scrapers.scrapers.title_data_scrapers.manga_updates_scraper import (
     MangaUpdatesParser,
 )
-from manga_scrapers.services.session_service import session_factory
-from manga_scrapers.client_handler.session_context_manager import Session
+from config.config import TITLE_METADATA_CACHE_SIZE
+from manga_scrapers.services.title_metadata_service import TitleMetadataCache
+from manga_scrapers.containers.client_container import ClientContainer
 
 
 class AuxScrapingContainer(containers.DeclarativeContainer):
@@ -15,16 +16,16 @@ class AuxScrapingContainer(containers.DeclarativeContainer):
             "manga_scrapers.scrapers.rating_scrapers.oricon_scraper",
             "manga_scrapers.scrapers.rating_scrapers.shoseki_scraper",
             "manga_scrapers.services.db_service",
+            "manga_scrapers.database_handler",
         ]
     )
-    web_session: providers.Resource[Session] = providers.Resource(
-        session_factory, Session
-    )
+    client = providers.Container(ClientContainer)
+    metadata_cache = providers.Singleton(TitleMetadataCache, TITLE_METADATA_CACHE_SIZE)
     manga_updates_scraper = providers.Factory(
         MangaUpdatesParser,
-        session=web_session,
+        session=client.web_session,
     )
     amazon_scraper = providers.Factory(
         AmazonParser,
-        session=web_session,
+        session=client.web_session,
     )
@@ -1,23 +1,31 @@
 # pyright: reportMissingModuleSource=false
 from __future__ import annotations
+import asyncio
 import datetime
 from dependency_injector.wiring import Provide, inject, Closing
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.engine.row import Row
 
+from config.config import SCRAPER_PARALLEL_WEEKS
+from manga_scrapers.containers.title_data_container import AuxScrapingContainer
 from manga_scrapers.scrapers.rating_scrapers.meta import MainDataAbstractScraper
 from manga_scrapers.dataclasses import Content
 from manga_scrapers.services.files_service import delete_images
+from manga_scrapers.services.title_metadata_service import AuxData, TitleMetadataCache
 
 from manga_sales.containers import DatabaseContainer
 from manga_sales.db.data_access_layers.author import AuthorDAO
+from manga_sales.db.data_access_layers.chart_entry import ChartEntryDAO
 from manga_sales.db.data_access_layers.item import ItemDAO
 from manga_sales.db.data_access_layers.publisher import PublisherDAO
 from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
 from manga_sales.db.data_access_layers.title import TitleDAO
+from manga_sales.db.data_access_layers.title_metadata import TitleMetadataDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
+from manga_sales.db.data_access_layers.week_calendar import WeekCalendarDAO
 from manga_sales.db.models import (
     Author,
+    ChartEntry,
     Item,
     PreviousRank,
     Publisher,
@@ -35,8 +43,10 @@ class DatabaseConnector:
     def __init__(
         self,
         scraper: MainDataAbstractScraper,
+        db_lock: asyncio.Lock | None = None,
     ) -> None:
         self.scraper = scraper
+        self.db_lock = db_lock or asyncio.Lock()
 
     @staticmethod
     @inject
@@ -44,8 +54,8 @@ class DatabaseConnector:
         authors: list[str],
         author_session: AuthorDAO = Closing[Provide[DatabaseContainer.authors]],
     ) -> list[Author]:
-        """Method fo detecting whether given authors already exist in db or not
-            and converting author names to instances of author model
+        """Method for upserting given authors and converting author names
+            to instances of author model
 
         Args:
             authors (list[str]): list of strings with author names
@@ -55,37 +65,28 @@ class DatabaseConnector:
         Returns:
             list[Author]: list with Authors either new or already existing in db
         """
-        existed_authors = await author_session.filter_by_name(authors)
-        new_authors = [
-            Author(name=author)
-            for author in authors
-            if author not in [author.name for author in existed_authors]
-        ]
-        author_session.add_all(new_authors)
-        existed_authors.extend(new_authors)
-        return existed_authors
+        list_authors: list[Author] = await author_session.upsert_by_name(authors)
+        return list_authors
 
     @staticmethod
     @inject
-    async def handle_title(
-        name: str, title_session: TitleDAO = Closing[Provide[DatabaseContainer.title]]
-    ) -> Title:
-        """Method fo detecting whether given title name already exist in db or not
-            and converting it to instances of title model
+    async def handle_titles(
+        names: list[str],
+        title_session: TitleDAO = Closing[Provide[DatabaseContainer.title]],
+    ) -> list[Title]:
+        """Method for upserting given title names with single query
+            and converting them to instances of title model
 
         Args:
-            name (str): title name
+            names (list[str]): list of title names
             title_session (TitleDAO, optional): Instance of Data object layer for title table.
                 Defaults to Closing[Provide[DatabaseContainer.title]].
 
         Returns:
-            Title: Instance of title table
+            list[Title]: list with Titles either new or already existing in db
         """
-        title = await title_session.filter_by_name(name)
-        if not title:
-            title = Title(name=name)
-            title_session.add(title)
-        return title
+        titles: list[Title] = await title_session.upsert_by_name(names)
+        return titles
 
     @staticmethod
     @inject
@@ -95,8 +96,8 @@ class DatabaseConnector:
             Provide[DatabaseContainer.publishers]
         ],
     ) -> list[Publisher]:
-        """Method fo detecting whether given publishers already exist in db or not
-            and converting publisher names to instances of publisher model
+        """Method for upserting given publishers and converting publisher names
+            to instances of publisher model
 
         Args:
             publishers (list[str]):list of strings with publishers names
@@ -106,15 +107,10 @@ class DatabaseConnector:
         Returns:
             list[Publisher]:  list with Publishers either new or already existing in db
         """
-        existed_publishers = await publishers_session.filter_by_name(publishers)
-        new_publishers = [
-            Publisher(name=publisher)
-            for publisher in publishers
-            if publisher not in [publisher.name for publisher in existed_publishers]
-        ]
-        publishers_session.add_all(new_publishers)
-        existed_publishers.extend(new_publishers)
-        return existed_publishers
+        list_publishers: list[Publisher] = await publishers_session.upsert_by_name(
+            publishers
+        )
+        return list_publishers
 
     @inject
     async def get_source_type(
@@ -141,41 +137,66 @@ class DatabaseConnector:
         )
         return source_type
 
+    async def resolve_names(
+        self, data: list[Content]
+    ) -> tuple[dict[str, Title], dict[str, Author], dict[str, Publisher]]:
+        """Collects names of titles, authors and publishers from whole week
+            and resolves each of entity types with single query
+
+        Args:
+            data (list[Content]): all contents of week
+
+        Returns:
+            tuple[dict[str, Title], dict[str, Author], dict[str, Publisher]]:
+            mappings from name to model instance for titles, authors and publishers
+        """
+        titles = await self.handle_titles([content.name for content in data])
+        authors = await self.handle_authors(
+            [author for content in data for author in content.authors]
+        )
+        publishers = await self.handle_publishers(
+            [publisher for content in data for publisher in content.publishers]
+        )
+        return (
+            {title.name: title for title in titles},
+            {author.name: author for author in authors},
+            {publisher.name: publisher for publisher in publishers},
+        )
+
     @staticmethod
     @inject
-    async def get_previous_place(
+    async def get_previous_places(
         prev_week: Week,
-        current_rank: int,
-        title: str,
+        data: list[Content],
         item_session: ItemDAO = Closing[Provide[DatabaseContainer.item]],
-    ) -> PreviousRank | None:
-        """Method for getting rating place in previous week for given title.
+    ) -> dict[tuple[str, int], PreviousRank]:
+        """Method for getting rating places in previous week for all titles of week.
 
         Args:
             prev_week (Week): Week instance
-            current_rank (int): rank that title has in current week
-            title (str): name of title
+            data (list[Content]): all contents of current week
             item_session (ItemDAO, optional): Instance of Data object layer for item table.
              Defaults to Closing[Provide[DatabaseContainer.item]].
 
         Returns:
-            PreviousRank | None: return previous rank enum object.
+            dict[tuple[str, int], PreviousRank]: previous rank enum objects
+            with (title name, current rank) pairs as keys.
         """
-        prev_rank_item = await item_session.get_previous_rank(
-            prev_week, current_rank, title
+        prev_ranks = await item_session.get_previous_ranks(
+            prev_week, [(content.name, content.rating) for content in data]
         )
-        return prev_rank_item
+        return prev_ranks
 
     @inject
-    async def create_item(
+    async def create_item(  # pylint: disable=too-many-arguments
         self,
         content: Content,
-        prev_week: Week | None,
+        prev_ranks: dict[tuple[str, int], PreviousRank],
+        titles: dict[str, Title],
+        authors: dict[str, Author],
+        publishers: dict[str, Publisher],
         item_session: ItemDAO = Closing[Provide[DatabaseContainer.item]],
     ) -> Item:
-        authors = await self.handle_authors(content.authors)
-        title = await self.handle_title(content.name)
-        publishers = await self.handle_publishers(content.publishers)
         item = Item(
             rating=content.rating,
             volume=content.volume,
@@ -183,17 +204,37 @@ class DatabaseConnector:
             release_date=content.release_date,
             sold=content.sales,
         )
-        if prev_week is not None:
-            prev_rank = await self.get_previous_place(
-                prev_week, content.rating, content.name
-            )
-            item.previous_rank = prev_rank
-        item.title = title
-        item.author.extend(authors)
-        item.publisher.extend(publishers)
+        item.previous_rank = prev_ranks.get((content.name, content.rating))
+        item.title = titles[content.name]
+        item.author.extend(authors[author] for author in dict.fromkeys(content.authors))
+        item.publisher.extend(
+            publishers[publisher] for publisher in dict.fromkeys(content.publishers)
+        )
         item_session.add(item)
         return item
 
+    @staticmethod
+    def create_chart_entry(content: Content, item: Item, week: Week) -> ChartEntry:
+        """Build denormalised snapshot of item for week chart"""
+        return ChartEntry(
+            item=item,
+            week_id=week.id,
+            week_date=week.date,
+            rating=content.rating,
+            title=content.name,
+            volume=content.volume,
+            release_date=(
+                content.release_date.strftime("%d-%m-%Y")
+                if content.release_date
+                else None
+            ),
+            authors=sorted(set(content.authors)),
+            publishers=sorted(set(content.publishers)),
+            image=content.image,
+            sold=content.sales,
+            previous_rank=item.previous_rank,
+        )
+
     @staticmethod
     async def get_previous_week(
         week: Week, source_type: SourceType | Row, week_session: WeekDAO
@@ -201,44 +242,220 @@ class DatabaseConnector:
         prev_week = await week_session.get_previous_week(week, source_type)
         return prev_week
 
+    @staticmethod
     @inject
-    async def insert_data(
+    async def save_title_metadata(
+        entries: dict[str, AuxData],
+        metadata_session: TitleMetadataDAO = Closing[
+            Provide[DatabaseContainer.title_metadata]
+        ],
+    ) -> None:
+        """Write data about titles resolved by auxiliary scrapers
+            to title metadata table
+
+        Args:
+            entries (dict[str, AuxData]): data of titles by original title name
+            metadata_session (TitleMetadataDAO, optional): Instance of Data object layer
+                for title metadata table.
+                Defaults to Closing[Provide[DatabaseContainer.title_metadata]].
+        """
+        await metadata_session.upsert(entries)
+
+    @staticmethod
+    @inject
+    async def save_chart_entries(
+        week: Week,
+        items: list[tuple[Content, Item]],
+        chart_session: ChartEntryDAO = Closing[Provide[DatabaseContainer.chart_entry]],
+        calendar_session: WeekCalendarDAO = Closing[
+            Provide[DatabaseContainer.week_calendar]
+        ],
+    ) -> None:
+        """Method for adding week to calendar and denormalised snapshots
+            of its items to week chart
+
+        Args:
+            week (Week): created week
+            items (list[tuple[Content, Item]]): scraped contents with created items
+            chart_session (ChartEntryDAO, optional): Instance of Data object layer
+             for chart entry table.
+             Defaults to Closing[Provide[DatabaseContainer.chart_entry]].
+            calendar_session (WeekCalendarDAO, optional): Instance of Data object
+             layer for week calendar table.
+             Defaults to Closing[Provide[DatabaseContainer.week_calendar]].
+        """
+        await calendar_session.add_week(week)
+        for content, item in items:
+            chart_session.add(DatabaseConnector.create_chart_entry(content, item, week))
+
+    @inject
+    async def save_data(  # pylint: disable=too-many-arguments
         self,
         date: datetime.date,
+        data: list[Content],
         week_session: WeekDAO = Closing[Provide[DatabaseContainer.week]],
-        session: AsyncSession = Closing[Provide[DatabaseContainer.session]],  # type: ignore
+        session: AsyncSession = Closing[Provide[DatabaseContainer.session]],
+        metadata_cache: TitleMetadataCache = Provide[
+            AuxScrapingContainer.metadata_cache
+        ],
     ) -> None:
+        """Method for writing scraped data of given week in database.
+
+        Args:
+            date (datetime.date): week date
+            data (list[Content]): scraped contents of week
+            week_session (WeekDAO, optional): Instance of Data object layer for week table.
+             Defaults to Closing[Provide[DatabaseContainer.week]].
+            metadata_cache (TitleMetadataCache, optional): cache shared with scrapers.
+             Defaults to Provide[AuxScrapingContainer.metadata_cache].
+        """
+        source_type = await self.get_source_type()
+        assert source_type is not None
+        week = await week_session.create_if_absent(date, source_type.id)
+        if week is None:
+            # week was already saved, e.g. by concurrently running scraper.
+            # Images are content-addressed, so its items may use the same
+            # files as scraped ones and nothing is deleted
+            await session.rollback()
+            return
+        prev_week = await self.get_previous_week(week, source_type, week_session)
+        prev_ranks = (
+            await self.get_previous_places(prev_week, data)
+            if prev_week is not None
+            else {}
+        )
+        titles, authors, publishers = await self.resolve_names(data)
+        items = []
+        for content in data:
+            item = await self.create_item(
+                content, prev_ranks, titles, authors, publishers
+            )
+            item.week_id = week.id
+            items.append((content, item))
+        await self.save_chart_entries(week, items)
+        # titles resolved since last week are saved within its transaction,
+        # so they are pending again if it's rolled back
+        pending = metadata_cache.pop_pending()
+        try:
+            await self.save_title_metadata(pending)
+            await session.commit()
+        except BaseException:
+            metadata_cache.requeue(pending)
+            raise
+
+    async def scrape_data(self, date: datetime.date) -> list[Content] | None:
+        """Method for scraping data of given week. Saved images are deleted
+            if scraping fails.
+
+        Args:
+            date (datetime.date): date from with need to scrape and get data
+            for given site
+
+        Returns:
+            list[Content] | None: list of Contents with data
+        """
+        date_str: str = date.strftime("%Y-%m-%d")
+        try:
+            data = await self.scraper.get_data(date_str)
+        except Exception as exc:
+            delete_images(self.scraper.SOURCE, self.scraper.SOURCE_TYPE, date_str)
+            raise exc
+        return data
+
+    async def write_data(self, date: datetime.date, data: list[Content]) -> None:
+        """Method for writing scraped data to database. Writing is guarded
+            with db_lock, so connectors of concurrently running scrapers
+            don't use shared database session at the same time.
+
+        Args:
+            date (datetime.date): week date
+            data (list[Content]): scraped contents of week
+        """
+        try:
+            async with self.db_lock:
+                await self.save_data(date, data)
+        except Exception as exc:
+            delete_images(
+                self.scraper.SOURCE,
+                self.scraper.SOURCE_TYPE,
+                date.strftime("%Y-%m-%d"),
+            )
+            raise exc
+
+    async def insert_data(self, date: datetime.date) -> None:
         """Main methof for inserting scraper data in database.
 
         Args:
             date (datetime.date): date from with need to scrape and get data
             for given site
-            week_session (WeekDAO, optional): Instance of Data object layer for week table.
-             Defaults to Closing[Provide[DatabaseContainer.week]].
 
         Raises:
             exc: raises an exception and deletes already saved images (if any)
             if something went wrong during the process of writing
             data to the database or scraping.
         """
-        date_str: str = date.strftime("%Y-%m-%d")
+        data = await self.scrape_data(date)
+        if data:
+            await self.write_data(date, data)
+
+    async def insert_weeks(
+        self, dates: list[datetime.date], parallel_weeks: int = SCRAPER_PARALLEL_WEEKS
+    ) -> None:
+        """Method for inserting data of many weeks with pipeline:
+            producer starts scraping of next weeks and puts them in bounded queue,
+            while consumer writes already scraped weeks in database.
+            Weeks are written strictly in order of dates, because previous rank
+            of each week depends on week before it.
+
+        Args:
+            dates (list[datetime.date]): sorted list of dates that need to be inserted
+            parallel_weeks (int, optional): number of weeks that can be scraped
+            at the same time, also used as size of queue.
+            Defaults to SCRAPER_PARALLEL_WEEKS.
+
+        Raises:
+            exc: raises an exception of first failed week, scraping of next weeks
+            is cancelled and their saved images are deleted.
+        """
+        semaphore = asyncio.Semaphore(parallel_weeks)
+        queue: asyncio.Queue[
+            tuple[datetime.date, asyncio.Task[list[Content] | None]] | None
+        ] = asyncio.Queue(maxsize=parallel_weeks)
+        tasks: list[tuple[datetime.date, asyncio.Task[list[Content] | None]]] = []
+
+        async def scrape(date: datetime.date) -> list[Content] | None:
+            async with semaphore:
+                return await self.scrape_data(date)
+
+        async def produce() -> None:
+            for date in dates:
+                task = asyncio.create_task(scrape(date))
+                tasks.append((date, task))
+                await queue.put((date, task))
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        written = 0
         try:
-            data = await self.scraper.get_data(date_str)
-            if data:
-                source_type = await self.get_source_type()
-                assert source_type is not None
-                week = Week(date=date, source_type_id=source_type.id)
-                items = []
-                prev_week = await self.get_previous_week(
-                    week, source_type, week_session
+            while (entry := await queue.get()) is not None:
+                date, task = entry
+                data = await task
+                if data:
+                    await self.write_data(date, data)
+                written += 1
+        finally:
+            producer.cancel()
+            for date, task in tasks[written:]:
+                task.cancel()
+            # wait until cancelled scrapers stop, so they don't save images
+            # after deletion or outlive connector
+            await asyncio.gather(
+                producer, *(task for _, task in tasks[written:]), return_exceptions=True
+            )
+            # images of failed week are already deleted by scrape_data/write_data
+            for date, task in tasks[written + 1 :]:
+                delete_images(
+                    self.scraper.SOURCE,
+                    self.scraper.SOURCE_TYPE,
+                    date.strftime("%Y-%m-%d"),
                 )
-                for content in data:
-                    item = await self.create_item(content, prev_week)
-                    items.append(item)
-                week.items.extend(items)
-                week_session.add(week)
-                await session.commit()
-
-        except Exception as exc:
-            delete_images(self.scraper.SOURCE, self.scraper.SOURCE_TYPE, date_str)
-            raise exc
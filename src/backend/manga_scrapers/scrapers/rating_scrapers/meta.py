@@ -78,6 +78,22 @@ class MainDataAbstractScraper(AbstractBase):
             datetime.date | None
         """
 
+    @abstractmethod
+    async def list_available_dates(
+        self, since: datetime.date | None, until: datetime.date
+    ) -> list[datetime.date]:
+        """Get dates of all charts published after since and not later than until
+            in one pass
+
+        Args:
+            since (datetime.date | None): date after which charts are searched,
+            if None then all charts are searched back from until
+            until (datetime.date): latest date that can be returned
+
+        Returns:
+            list[datetime.date]: sorted list of dates
+        """
+
     @abstractmethod
     async def get_image(  # pylint: disable=too-many-arguments
         self,
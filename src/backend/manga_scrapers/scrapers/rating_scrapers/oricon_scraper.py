@@ -3,6 +3,7 @@ import datetime
 import asyncio
 import operator
 import re
+from typing import cast
 from bs4 import BeautifulSoup
 from dependency_injector.wiring import Provide, inject, Closing
 
@@ -10,10 +11,11 @@ from manga_scrapers.scrapers.title_data_scrapers.meta import AuxDataParserAbstra
 from manga_scrapers.containers.title_data_container import AuxScrapingContainer
 from manga_scrapers.containers.image_container import ImageScrapingContainer
 from manga_scrapers.dataclasses import Content
-from manga_scrapers.exceptions import BSError, NotFound, Unsuccessful
+from manga_scrapers.exceptions import BSError, ConnectError, NotFound, Unsuccessful
 from manga_scrapers.scrapers.image_scrapers.meta import AbstractImageScraper
 from manga_scrapers.scrapers.rating_scrapers.meta import MainDataAbstractScraper
-from manga_scrapers.services.files_service import save_image
+from manga_scrapers.services.files_service import find_image, save_image
+from manga_scrapers.services.title_metadata_service import TitleMetadataCache
 from manga_scrapers.utils.url_handler import build_url, update_url
 
 TITLE_DATE_PATTERN_MATCH = r"(?P<year>\d{4})年(?P<month>\d{2})月"
@@ -87,9 +89,13 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
         aux_scraper: AuxDataParserAbstract = Closing[
             Provide[AuxScrapingContainer.manga_updates_scraper]
         ],
+        metadata_cache: TitleMetadataCache = Provide[
+            AuxScrapingContainer.metadata_cache
+        ],
     ) -> tuple[str, list[str], list[str]]:
         """Fetch and parse additional data about given title,
-        including its name in english(romaji) and authors and publishers
+        including its name in english(romaji) and authors and publishers.
+        Data of titles that were already resolved is taken from cache.
 
         Args:
             item (BeautifulSoup): page
@@ -98,6 +104,9 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
             tuple[str, list[str], list[str]]: name, authors, publishers
         """
         original_title = self._get_original_title(item)
+        cached = metadata_cache.get(original_title)
+        if cached is not None:
+            return cached
         try:
             async with aux_scraper(title=original_title):
                 name = aux_scraper.get_title()
@@ -105,6 +114,7 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
                 publishers = aux_scraper.get_publishers()
         except Exception:  # pylint: disable = broad-except
             return original_title, [], []
+        metadata_cache.set(original_title, (name, authors, publishers))
         return name, authors, publishers
 
     async def create_content_item(
@@ -138,7 +148,15 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
         )
         return content
 
-    async def _retrieve_data(self, url: str, date: str) -> list[Content]:
+    @inject
+    async def _retrieve_data(
+        self,
+        url: str,
+        date: str,
+        metadata_cache: TitleMetadataCache = Provide[
+            AuxScrapingContainer.metadata_cache
+        ],
+    ) -> list[Content]:
         """Method for collecting all data about all titles for given page in single list
 
         Args:
@@ -149,6 +167,12 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
             list[Content]: list fo contents
         """
         list_items = await self._get_list_raw_data(url)
+        await metadata_cache.preload(
+            [
+                self._get_original_title(item)
+                for item in cast(list[BeautifulSoup], list_items)
+            ]
+        )
         tasks = [
             asyncio.create_task(self.create_content_item(i, item, date))
             for i, item in enumerate(list_items, start=1)
@@ -240,15 +264,75 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
             Provide[ImageScrapingContainer.cdjapan_scraper]
         ],
     ) -> str | None:
+        stored_image = find_image(self.SOURCE, self.SOURCE_TYPE, date, name, volume)
+        if stored_image:
+            return stored_image
         str_info = item.find("h2", {"class": "title"}).string
         try:
             image = await image_scraper.get_image(str_info, name, volume)
         except (Unsuccessful, NotFound):
             image = await self._get_image(item)
-        name = save_image(self.SOURCE, self.SOURCE_TYPE, image, date)
-        return name
+        return save_image(self.SOURCE, self.SOURCE_TYPE, image, date, name, volume)
+
+    async def _probe_date(self, date: datetime.date) -> datetime.date | None:
+        """Checks whether chart for given date exists. Date whose page fails
+            to load after all retries is treated as missing
+
+        Args:
+            date (datetime.date): guessed date
+
+        Returns:
+            datetime.date | None: given date if chart exists else None
+        """
+        url = update_url(
+            self.MAIN_URL,
+            path=[date.strftime("%Y-%m-%d")],
+            trailing_slash=True,
+        )
+        try:
+            await self.fetch(url, return_bs=False)
+        except (ConnectError, NotFound, Unsuccessful):
+            return None
+        return date
+
+    async def _probe_week(self, dates: list[datetime.date]) -> list[datetime.date]:
+        """Concurrently checks all given candidate dates
+
+        Args:
+            dates (list[datetime.date]): candidate dates
+
+        Returns:
+            list[datetime.date]: sorted dates for which chart exists
+        """
+        found = await asyncio.gather(*(self._probe_date(date) for date in dates))
+        return sorted(date for date in found if date)
 
     # ------------methods that can be invoked somewhere outside------------
+    async def list_available_dates(
+        self, since: datetime.date | None, until: datetime.date
+    ) -> list[datetime.date]:
+        # charts are weekly, so all seven days of the window are probed at once.
+        # Searching back stops at first week without chart, as find_latest_date does
+        dates: list[datetime.date] = []
+        if since is None:
+            end = until
+            while found := await self._probe_week(
+                [end - datetime.timedelta(days=x) for x in range(7)]
+            ):
+                dates.extend(found)
+                end -= datetime.timedelta(days=7)
+            return sorted(dates)
+        start = since
+        while start < until:
+            window = [
+                start + datetime.timedelta(days=x)
+                for x in range(1, 8)
+                if start + datetime.timedelta(days=x) <= until
+            ]
+            dates.extend(await self._probe_week(window))
+            start = window[-1]
+        return dates
+
     async def find_latest_date(
         self,
         date: datetime.date,
@@ -268,7 +352,7 @@ class OriconWeeklyScraper(MainDataAbstractScraper):
             )
             try:
                 await self.fetch(url, return_bs=False)
-            except (ConnectionError, NotFound):
+            except (ConnectError, NotFound, Unsuccessful):
                 count_days += 1
                 continue
             return guess_date
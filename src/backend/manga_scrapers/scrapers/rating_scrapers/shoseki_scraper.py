@@ -4,9 +4,11 @@ import datetime
 import operator
 import re
 import unicodedata
+from typing import cast
 from bs4 import BeautifulSoup
 from dependency_injector.wiring import Provide, inject, Closing
 
+from manga_scrapers.client_handler.session_context_manager import Session
 from manga_scrapers.scrapers.rating_scrapers.meta import MainDataAbstractScraper
 from manga_scrapers.scrapers.title_data_scrapers.amazon_scraper import AmazonParser
 from manga_scrapers.scrapers.title_data_scrapers.meta import AuxDataParserAbstract
@@ -15,7 +17,8 @@ from manga_scrapers.containers.image_container import ImageScrapingContainer
 from manga_scrapers.dataclasses import Content
 from manga_scrapers.exceptions import NotFound, Unsuccessful
 from manga_scrapers.scrapers.image_scrapers.meta import AbstractImageScraper
-from manga_scrapers.services.files_service import save_image
+from manga_scrapers.services.files_service import find_image, save_image
+from manga_scrapers.services.title_metadata_service import TitleMetadataCache
 from manga_scrapers.utils.date_helper import convert_str_to_date
 from manga_scrapers.utils.url_handler import build_url
 
@@ -42,8 +45,35 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
         ],
     )
 
+    def __init__(self, session: Session) -> None:
+        super().__init__(session)
+        self._index: list[BeautifulSoup] | None = None
+
     # ------------helper methods for main methods------------
 
+    async def _get_index(self) -> list[BeautifulSoup]:
+        """Fetches main page with list of all charts. Page is fetched and parsed
+            only once for scraper instance
+
+        Raises:
+            error: raises Attribute error if an error occurs while parsing
+
+        Returns:
+            list[BeautifulSoup]: list of rows with chart date and link to it
+        """
+        if self._index is None:
+            main_page: BeautifulSoup = await self.fetch(
+                self.MAIN_URL, commands=["content", "read"]
+            )
+            try:
+                self._index = cast(
+                    list[BeautifulSoup],
+                    main_page.find("ul", {"class": "list_body"}).find_all("li"),
+                )
+            except AttributeError as error:
+                raise error
+        return self._index
+
     async def _get_list_raw_data(self, url: str) -> list[list[str]]:
         """Extracts all the required data from the page
 
@@ -79,9 +109,13 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
         aux_scraper: AuxDataParserAbstract = Closing[
             Provide[AuxScrapingContainer.manga_updates_scraper]
         ],
+        metadata_cache: TitleMetadataCache = Provide[
+            AuxScrapingContainer.metadata_cache
+        ],
     ) -> tuple[str, list[str], list[str]]:
         """Fetch and parse additional data about given title,
-        including its name in english(romaji) and authors and publishers
+        including its name in english(romaji) and authors and publishers.
+        Data of titles that were already resolved is taken from cache.
 
         Args:
             item (BeautifulSoup): page
@@ -90,6 +124,9 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
             tuple[str, list[str], list[str]]: name, authors, publishers
         """
         original_title = self._get_original_title(item)
+        cached = metadata_cache.get(original_title)
+        if cached is not None:
+            return cached
         try:
             async with aux_scraper(title=original_title):
                 name = aux_scraper.get_title()
@@ -97,6 +134,7 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
                 publishers = aux_scraper.get_publishers()
         except Exception:  # pylint: disable = broad-except
             return original_title, [], []
+        metadata_cache.set(original_title, (name, authors, publishers))
         return name, authors, publishers
 
     @inject
@@ -163,7 +201,15 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
         )
         return content
 
-    async def _retrieve_data(self, url: str, date: str) -> list[Content]:
+    @inject
+    async def _retrieve_data(
+        self,
+        url: str,
+        date: str,
+        metadata_cache: TitleMetadataCache = Provide[
+            AuxScrapingContainer.metadata_cache
+        ],
+    ) -> list[Content]:
         """Method for iterating of list of data and collecting data for each of them
 
         Args:
@@ -174,6 +220,9 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
             list[Content]: list with Contents instances
         """
         list_items = await self._get_list_raw_data(url)
+        await metadata_cache.preload(
+            [self._get_original_title(row[2]) for row in list_items]
+        )
         tasks = [
             asyncio.create_task(self.create_content_item(i, row, date))
             for i, row in enumerate(list_items)
@@ -194,15 +243,7 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
         Returns:
             str | None: return url to found url or none, of that url doesnt exist
         """
-        main_page: BeautifulSoup = await self.fetch(
-            self.MAIN_URL, commands=["content", "read"]
-        )
-        try:
-            dates: list[BeautifulSoup] = main_page.find(
-                "ul", {"class": "list_body"}
-            ).find_all("li")
-        except AttributeError as error:
-            raise error
+        dates = await self._get_index()
         for date_obj in dates:
             guess_date: str = re.sub(
                 LIST_DATE_PATERN_MATCH,
@@ -258,13 +299,15 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
             Provide[ImageScrapingContainer.cdjapan_scraper]
         ],
     ) -> str | None:
+        stored_image = find_image(self.SOURCE, self.SOURCE_TYPE, date, name, volume)
+        if stored_image:
+            return stored_image
         str_info = f"{self._get_original_title(item[2])} {volume}"
         try:
             image = await image_scraper.get_image(str_info, name, volume)
         except (Unsuccessful, NotFound):
             image = await self._get_image(item[1])
-        name = save_image(self.SOURCE, self.SOURCE_TYPE, image, date)
-        return name
+        return save_image(self.SOURCE, self.SOURCE_TYPE, image, date, name, volume)
 
     @staticmethod
     def get_rating(item: str) -> int | None:
@@ -299,15 +342,7 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
         self, date: datetime.date, action: str
     ) -> datetime.date | None:
         assert action in ("forward", "backward")
-        main_page: BeautifulSoup = await self.fetch(
-            self.MAIN_URL, commands=["content", "read"]
-        )
-        try:
-            dates: list[BeautifulSoup] = main_page.find(
-                "ul", {"class": "list_body"}
-            ).find_all("li")
-        except AttributeError as error:
-            raise error
+        dates = await self._get_index()
         date = (
             operator.add(date, datetime.timedelta(days=1))
             if action == "forward"
@@ -325,3 +360,16 @@ class ShosekiWeeklyScraper(MainDataAbstractScraper):
             ):
                 return guessed_date
         return None
+
+    async def list_available_dates(
+        self, since: datetime.date | None, until: datetime.date
+    ) -> list[datetime.date]:
+        dates = await self._get_index()
+        available_dates = [
+            convert_str_to_date(str(row.text), TITLE_DATE_PATERN_MATCH) for row in dates
+        ]
+        return sorted(
+            date
+            for date in available_dates
+            if (since is None or date > since) and date <= until
+        )
@@ -51,7 +51,7 @@ class AmazonParser(AuxDataParserAbstract):
     async def fetch(
         self, url: str, commands: list[str] | None = None, return_bs: bool = True
     ) -> Any:
-        response = await self.session.fetch(url, commands=commands, sleep_time=3)
+        response = await self.session.fetch(url, commands=commands)
         return BeautifulSoup(response, "html.parser") if return_bs else response
 
     def _get_most_similar_title(
@@ -1,20 +1,27 @@
+import asyncio
 import datetime
 import functools
-
-# import asyncio
+import logging
 from typing import Any, Awaitable, Callable, Coroutine, ParamSpec, TypeVar
+from dependency_injector import providers
 from dependency_injector.wiring import Provide, inject, Closing
+from manga_scrapers.containers.client_container import ClientContainer
 from manga_scrapers.containers.title_data_container import AuxScrapingContainer
 from manga_scrapers.containers.image_container import ImageScrapingContainer
 from manga_scrapers.containers.rating_container import DataScrapingContainer
 from manga_scrapers.database_handler import DatabaseConnector
 from manga_scrapers.scrapers.rating_scrapers.meta import MainDataAbstractScraper
+from manga_scrapers.services.title_metadata_service import AuxData, TitleMetadataCache
+from manga_sales.db.data_access_layers.source_type import SourceTypeDAO
+from manga_sales.db.data_access_layers.title_metadata import TitleMetadataDAO
 from manga_sales.db.data_access_layers.week import WeekDAO
 from manga_sales.containers import DatabaseContainer
 
 MainFuncParams = ParamSpec("MainFuncParams")
 MainFunc = TypeVar("MainFunc")
 
+logger = logging.getLogger(__name__)
+
 
 def return_db_cont() -> DatabaseContainer:
     """Function to invode container for database"""
@@ -44,18 +51,19 @@ def create_scraper_container(
     async def wrapper(
         *args: MainFuncParams.args, **kwargs: MainFuncParams.kwargs
     ) -> None:
-        data_container = DataScrapingContainer()
-        data_container.init_resources()
-        aux_container = AuxScrapingContainer()
-        aux_container.init_resources()
-        img_cntainer = ImageScrapingContainer()
-        img_cntainer.init_resources()
+        # all scraping containers share one http client and its connection pool
+        client_container = ClientContainer()
+        client_container.init_resources()
+        data_container = DataScrapingContainer(client=client_container)
+        aux_container = AuxScrapingContainer(client=client_container)
+        img_cntainer = ImageScrapingContainer(client=client_container)
         try:
             await func(*args, **kwargs)
         finally:
-            await data_container.shutdown_resources()  # type: ignore  # pylint: disable=no-member
-            await aux_container.shutdown_resources()  # type: ignore  # pylint: disable=no-member
-            await img_cntainer.shutdown_resources()  # type: ignore  # pylint: disable=no-member
+            await client_container.shutdown_resources()  # type: ignore  # pylint: disable=no-member
+            data_container.unwire()  # pylint: disable=no-member
+            aux_container.unwire()  # pylint: disable=no-member
+            img_cntainer.unwire()  # pylint: disable=no-member
 
     return wrapper
 
@@ -74,51 +82,177 @@ async def scraper_factory(
         raise exc
 
 
+def plan_dates(
+    dates: list[datetime.date],
+    existing_weeks: set[tuple[datetime.date, int]],
+    source_type_id: int,
+) -> list[datetime.date]:
+    """Diff discovered dates against existing weeks of the same source type.
+
+    Args:
+        dates (list[datetime.date]): dates available on scraped site
+        existing_weeks (set[tuple[datetime.date, int]]): (date, source_type_id)
+            pairs of weeks already stored for source
+        source_type_id (int): id of scraper source type
+
+    Returns:
+        list[datetime.date]: sorted list of dates without duplicates
+    """
+    planned: set[datetime.date] = set()
+    for date in dates:
+        if (date, source_type_id) not in existing_weeks:
+            planned.add(date)
+    return sorted(planned)
+
+
 @inject
-async def get_date(
+async def get_date_list(
     scraper: MainDataAbstractScraper,
-    date: datetime.date | None = None,
+    db_lock: asyncio.Lock | None = None,
     week_session: WeekDAO = Closing[Provide[DatabaseContainer.week]],
-) -> datetime.date | None:
-    action = "backward"
-    if date is None:
-        date = await week_session.get_last_date(scraper.SOURCE, scraper.SOURCE_TYPE)
-        if date:
-            action = "forward"
-        else:
-            date = datetime.date.today()
-    else:
-        check_date = await week_session.get_last_date(
+    source_type_session: SourceTypeDAO = Closing[
+        Provide[DatabaseContainer.source_type]
+    ],
+) -> list[datetime.date]:
+    """Get sorted list of dates that need to be scraped. All available dates
+        are discovered by scraper in one pass and compared with existing weeks
+        of source loaded with single query. Only database queries are guarded
+        with db_lock, so discovery of concurrently running scrapers is not
+        serialized.
+
+    Args:
+        scraper (MainDataAbstractScraper): scraper instance
+        db_lock (asyncio.Lock | None, optional): lock guarding database session.
+            Defaults to None.
+        week_session (WeekDAO, optional): Instance of Data object layer for week table.
+            Defaults to Closing[Provide[DatabaseContainer.week]].
+        source_type_session (SourceTypeDAO, optional): Instance of Data object layer
+            for source type table. Defaults to Closing[Provide[DatabaseContainer.source_type]].
+
+    Returns:
+        list[datetime.date]: sorted list of dates
+    """
+    db_lock = db_lock or asyncio.Lock()
+    async with db_lock:
+        last_date = await week_session.get_last_date(
             scraper.SOURCE, scraper.SOURCE_TYPE
         )
-        if check_date:
-            action = "forward"
-    valid_date = await scraper.find_latest_date(date, action)
+    dates = await scraper.list_available_dates(last_date, datetime.date.today())
+    async with db_lock:
+        source_type = await source_type_session.get_by_source(
+            scraper.SOURCE, scraper.SOURCE_TYPE
+        )
+        assert source_type is not None
+        existing_weeks = await week_session.get_source_weeks(scraper.SOURCE)
+    return plan_dates(dates, existing_weeks, source_type.id)
+
+
+@inject
+async def lookup_title_metadata(
+    original_titles: list[str],
+    db_lock: asyncio.Lock,
+    metadata_session: TitleMetadataDAO = Closing[
+        Provide[DatabaseContainer.title_metadata]
+    ],
+) -> dict[str, AuxData]:
+    """Get stored data of given original titles from database
+
+    Args:
+        original_titles (list[str]): original title names
+        db_lock (asyncio.Lock): lock guarding database session
+        metadata_session (TitleMetadataDAO, optional): Instance of Data object layer
+            for title metadata table.
+            Defaults to Closing[Provide[DatabaseContainer.title_metadata]].
+
+    Returns:
+        dict[str, AuxData]: name, authors and publishers of found titles
+    """
+    async with db_lock:
+        rows = await metadata_session.get_by_original_titles(original_titles)
+    return {row.original_title: (row.name, row.authors, row.publishers) for row in rows}
 
-    assert valid_date is None or isinstance(valid_date, datetime.date)
-    if valid_date:
-        if await week_session.get(valid_date):
-            return await get_date(scraper, valid_date)
-    return valid_date
 
+@inject
+async def load_title_metadata(
+    db_lock: asyncio.Lock,
+    metadata_session: TitleMetadataDAO = Closing[
+        Provide[DatabaseContainer.title_metadata]
+    ],
+    metadata_cache: TitleMetadataCache = Provide[AuxScrapingContainer.metadata_cache],
+) -> None:
+    """Fill title metadata cache with most recently resolved titles from database,
+        other titles are looked up when scrapers miss them in cache.
+        Cache is shared by scrapers, so it's loaded only once.
+
+    Args:
+        db_lock (asyncio.Lock): lock guarding database session
+        metadata_session (TitleMetadataDAO, optional): Instance of Data object layer
+            for title metadata table.
+            Defaults to Closing[Provide[DatabaseContainer.title_metadata]].
+        metadata_cache (TitleMetadataCache, optional): cache shared with scrapers.
+            Defaults to Provide[AuxScrapingContainer.metadata_cache].
+    """
+    metadata_cache.loader = functools.partial(lookup_title_metadata, db_lock=db_lock)
+    if metadata_cache.loaded:
+        return
+    async with db_lock:
+        rows = await metadata_session.get_recent(metadata_cache.max_size)
+    metadata_cache.load(
+        [(row.original_title, (row.name, row.authors, row.publishers)) for row in rows]
+    )
+
+
+def get_scraper_names() -> list[str]:
+    """Returns names of all scrapers registered in DataScrapingContainer"""
+    return [
+        name
+        for name, provider in DataScrapingContainer.providers.items()
+        if isinstance(provider, providers.Factory)
+    ]
 
-async def get_date_list(scraper: MainDataAbstractScraper) -> list[datetime.date]:
-    date_list = []
-    scraper_date = await get_date(scraper)
-    if scraper_date:
-        date_list.append(scraper_date)
-    while scraper_date:
-        scraper_date = await get_date(scraper, scraper_date)
-        if scraper_date:
-            date_list.append(scraper_date)
-    return sorted(date_list)
+
+async def run_scraper(scraper_name: str, db_lock: asyncio.Lock | None = None) -> None:
+    """Scrapes and saves all missing weeks for given scraper.
+        Containers must be already created by caller.
+
+    Args:
+        scraper_name (str): name of scraper provider in DataScrapingContainer
+        db_lock (asyncio.Lock | None, optional): lock guarding database session,
+        must be shared by scrapers that run concurrently. Defaults to None.
+    """
+    db_lock = db_lock or asyncio.Lock()
+    scraper = await scraper_factory(scraper_name)
+    db_conn = DatabaseConnector(scraper, db_lock)
+    date_list = await get_date_list(scraper, db_lock)
+    await load_title_metadata(db_lock)
+    await db_conn.insert_weeks(date_list)
 
 
 @create_db_container
 @create_scraper_container
 async def execute_scraper(scraper_name: str) -> None:
-    scraper = await scraper_factory(scraper_name)
-    db_conn = DatabaseConnector(scraper)
-    date_list = await get_date_list(scraper)
-    for date in date_list:
-        await db_conn.insert_data(date)
+    await run_scraper(scraper_name)
+
+
+@create_db_container
+@create_scraper_container
+async def execute_scrapers(scraper_names: list[str], max_concurrency: int) -> None:
+    """Runs given scrapers concurrently. Containers are created once and shared
+        by all scrapers, because wiring of containers is global for modules.
+        Failure of one scraper is logged and doesn't affect the others.
+
+    Args:
+        scraper_names (list[str]): names of scrapers providers in DataScrapingContainer
+        max_concurrency (int): maximum number of scrapers that run at the same time
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    db_lock = asyncio.Lock()
+
+    async def run(scraper_name: str) -> None:
+        async with semaphore:
+            try:
+                await run_scraper(scraper_name, db_lock)
+            except Exception:  # pylint: disable = broad-except
+                logger.exception("Scraper %s failed", scraper_name)
+
+    await asyncio.gather(*(run(scraper_name) for scraper_name in scraper_names))
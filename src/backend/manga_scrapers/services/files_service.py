@@ -1,18 +1,91 @@
+import hashlib
+import os
 from pathlib import Path
 import shutil
 import uuid
 
+IMAGES_PATH = "static/images"
+# content-addressed store of images shared by all sources,
+# week directories contain hard links to files from it
+IMAGE_STORE_PATH = f"{IMAGES_PATH}/store"
 
-def save_image(source: str, source_type: str, file: bytes, date: str) -> str:
-    """Saves image in path defined with source and data_type arguments with following path:
-        Path: 'manga_sales/static/images/{source}/{data_type}/'
+
+def _week_path(source: str, source_type: str, date: str) -> Path:
+    return Path(f"{IMAGES_PATH}/{source.lower()}/{source_type.lower()}/{date}")
+
+
+def _title_key_path(title: str, volume: int | None) -> Path:
+    key = hashlib.sha256(f"{title}\x00{volume}".encode()).hexdigest()
+    return Path(IMAGE_STORE_PATH) / "titles" / key
+
+
+def _link_image(blob: Path, source: str, source_type: str, date: str) -> str:
+    """Make stored image available in week directory under its digest name"""
+    path = _week_path(source, source_type, date)
+    path.mkdir(parents=True, exist_ok=True)
+    target = path / blob.name
+    if not target.exists():
+        try:
+            os.link(blob, target)
+        except OSError:
+            shutil.copyfile(blob, target)
+    return blob.name
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{uuid.uuid4()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def find_image(
+    source: str, source_type: str, date: str, title: str, volume: int | None
+) -> str | None:
+    """Looks up image already stored for given title volume and links it
+        in path of given week, so no image needs to be downloaded
+
+    Args:
+        source (str): type of source data (oricon etc)
+        source_type (str): data type (weekly, monthly etc)
+        date (str): date in string format
+        title (str): title name
+        volume (int | None): volume number
+
+    Returns:
+        str | None: name of image if it's stored else None
+    """
+    key_path = _title_key_path(title, volume)
+    try:
+        digest = key_path.read_text()
+    except OSError:
+        return None
+    blob = Path(IMAGE_STORE_PATH) / "blobs" / f"{digest}.jpg"
+    if not blob.exists():
+        return None
+    return _link_image(blob, source, source_type, date)
+
+
+def save_image(
+    source: str,
+    source_type: str,
+    file: bytes,
+    date: str,
+    title: str | None = None,
+    volume: int | None = None,
+) -> str:
+    """Saves image in content-addressed store and links it in path defined
+        with source and data_type arguments with following path:
+        Path: 'static/images/{source}/{data_type}/{date}/{sha256}.jpg'
+        Identical images are stored once and get the same name.
 
     Args:
         source (str): type of source data (oricon etc)
         data_type (str): data type (weekly, monthly etc)
         file (bytes): image file that need to be saved
-        name (str): file name
         date (str): date in string format
+        title (str | None, optional): title name, if given image is remembered
+            for given title volume. Defaults to None.
+        volume (int | None, optional): volume number. Defaults to None.
     """
     # confirm that all arguments needed for path are str type
     assert (
@@ -20,14 +93,18 @@ def save_image(source: str, source_type: str, file: bytes, date: str) -> str:
         and isinstance(source_type, str)
         and isinstance(date, str)
     )
-    image_path = f"static/images/{source.lower()}/{source_type.lower()}/{date}"
-    name = f"{uuid.uuid4()}.jpg"
-    path = Path(image_path)
+    digest = hashlib.sha256(file).hexdigest()
+    blob_path = Path(IMAGE_STORE_PATH) / "blobs"
     # ensure that given path exist or create it
-    path.mkdir(parents=True, exist_ok=True)
-    with open(path / f"{name}", "wb") as open_file:
-        open_file.write(file)
-    return name
+    blob_path.mkdir(parents=True, exist_ok=True)
+    blob = blob_path / f"{digest}.jpg"
+    if not blob.exists():
+        _write_atomic(blob, file)
+    if title is not None:
+        key_path = _title_key_path(title, volume)
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(key_path, digest.encode())
+    return _link_image(blob, source, source_type, date)
 
 
 def delete_images(source: str, source_type: str, date: str) -> None:
@@ -35,6 +112,6 @@ def delete_images(source: str, source_type: str, date: str) -> None:
     def handler(func, path, exc_info) -> None:  # type: ignore
         print(exc_info)
 
-    path = f"static/images/{source.lower()}/{source_type.lower()}/{date}"
-    # remove if exists
+    path = _week_path(source, source_type, date)
+    # remove if exists, only links are removed, stored images remain in store
     shutil.rmtree(path, onerror=handler)
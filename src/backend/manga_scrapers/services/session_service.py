@@ -1,6 +1,16 @@
-from typing import Any
+from typing import Any, AsyncIterator
+import aiohttp
+from manga_scrapers.client_handler.session_context_manager import create_connector
 
 
 async def session_factory(session: Any, *args: Any, **kwargs: Any) -> Any:
     async with session(*args, **kwargs) as obj:
         yield obj
+
+
+async def connector_factory() -> AsyncIterator[aiohttp.TCPConnector]:
+    connector = create_connector()
+    try:
+        yield connector
+    finally:
+        await connector.close()
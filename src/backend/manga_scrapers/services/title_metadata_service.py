@@ -0,0 +1,73 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+AuxData = tuple[str, list[str], list[str]]
+# looks up stored data of given original titles, titles that are not found
+# are missing in returned mapping
+Loader = Callable[[list[str]], Awaitable[dict[str, AuxData]]]
+
+
+class TitleMetadataCache:
+    """
+    In-process LRU cache of data collected from auxiliary scrapers
+    (name, authors, publishers) keyed by original title name.
+    It is filled with most recently updated rows of title_metadata table
+    before scraping, titles that are not cached are looked up in the table
+    by loader. Entries added during scraping are kept as pending until
+    they are written to the table.
+    Args:
+        max_size: maximum number of cached titles
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entries: OrderedDict[str, AuxData] = OrderedDict()
+        self.pending: dict[str, AuxData] = {}
+        self.loaded = False
+        self.loader: Loader | None = None
+
+    def get(self, original_title: str) -> AuxData | None:
+        data = self.entries.get(original_title)
+        if data is not None:
+            self.entries.move_to_end(original_title)
+        return data
+
+    def _put(self, original_title: str, data: AuxData) -> None:
+        self.entries[original_title] = data
+        self.entries.move_to_end(original_title)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def set(self, original_title: str, data: AuxData) -> None:
+        """Cache newly scraped data and mark it for saving in database"""
+        self._put(original_title, data)
+        self.pending[original_title] = data
+
+    def load(self, entries: list[tuple[str, AuxData]]) -> None:
+        """Fill cache with entries stored in database, ordered from
+        most to least recently used"""
+        for original_title, data in reversed(entries):
+            if original_title not in self.entries:
+                self._put(original_title, data)
+        self.loaded = True
+
+    async def preload(self, original_titles: list[str]) -> None:
+        """Look up titles that are not cached with single call of loader"""
+        missing = [x for x in dict.fromkeys(original_titles) if x not in self.entries]
+        if not missing or self.loader is None:
+            return
+        found = await self.loader(missing)  # pylint: disable=not-callable
+        for original_title, data in found.items():
+            if original_title not in self.entries:
+                self._put(original_title, data)
+
+    def pop_pending(self) -> dict[str, AuxData]:
+        pending, self.pending = self.pending, {}
+        return pending
+
+    def requeue(self, entries: dict[str, AuxData]) -> None:
+        """Mark popped entries as pending again, e.g. after failed commit.
+        Entries set since they were popped are kept"""
+        for original_title, data in entries.items():
+            self.pending.setdefault(original_title, data)
@@ -105,6 +105,15 @@ async def manga_updates_container():
     container = AuxScrapingContainer()
     yield await container.manga_updates_scraper()
     await container.shutdown_resources()
+    container.reset_singletons()
+
+
+@pytest_asyncio.fixture
+async def aux_container():
+    container = AuxScrapingContainer()
+    yield container
+    container.reset_singletons()
+    container.unwire()
 
 
 @pytest_asyncio.fixture
@@ -112,6 +121,7 @@ async def amazon_container():
     container = AuxScrapingContainer()
     yield await container.amazon_scraper()
     await container.shutdown_resources()
+    container.reset_singletons()
 
 
 @pytest_asyncio.fixture
@@ -1,19 +1,22 @@
+import asyncio
 import datetime
 import random
 from unittest import mock
 from manga_scrapers.database_handler import DatabaseConnector
+from manga_scrapers.services.db_service import lookup_title_metadata
 from manga_scrapers.dataclasses import Content
 from manga_scrapers.test.conftest import (
     oricon_container,
+    aux_container,
     db_session_container,
     create_data_scraper,
 )
 import pytest
 
-from manga_sales.db.models import Author, Item, PreviousRank, Publisher, Week
+from manga_sales.db.models import Author, Item, PreviousRank, Publisher, Title, Week
 
 
-@pytest.mark.usefixtures("create_data_scraper")
+@pytest.mark.usefixtures("create_data_scraper", "aux_container")
 class TestDatabaseSaver:
     @mock.patch(
         "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
@@ -52,6 +55,20 @@ class TestDatabaseSaver:
             assert item.release_date == content.release_date
             assert sorted(item.authors) == sorted(content.authors)
             assert sorted(item.publishers) == sorted(content.publishers)
+        entries = await db_session_container.chart_entry().get_by_date(
+            dte.strftime("%Y-%m-%d")
+        )
+        assert len(entries) == 30
+        for entry, content in zip(entries, contents):
+            assert entry.title == content.name
+            assert entry.rating == content.rating
+            assert entry.release_date == content.release_date.strftime("%d-%m-%Y")
+            assert entry.authors == sorted(content.authors)
+            assert entry.publishers == sorted(content.publishers)
+        calendar = await db_session_container.week_calendar().get_by_source(
+            cont.scraper.SOURCE, cont.scraper.SOURCE_TYPE
+        )
+        assert any(11 in x.get("2022", {}).get("November", []) for x in calendar)
 
     @mock.patch(
         "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
@@ -65,7 +82,7 @@ class TestDatabaseSaver:
         )
         week_session = db_session_container.week()
         item_session = db_session_container.item()
-        title = await cont.handle_title("test")
+        (title,) = await cont.handle_titles(["test"])
         item = Item(
             rating=1,
             volume=2,
@@ -101,6 +118,10 @@ class TestDatabaseSaver:
         assert count == 2
         assert res[0].rating == 2
         assert res[0].previous_rank == PreviousRank.DOWN
+        entries = await db_session_container.chart_entry().get_by_date(
+            dte.strftime("%Y-%m-%d")
+        )
+        assert entries[0].previous_rank == PreviousRank.DOWN
 
     async def test_prev_week(self, db_session_container, oricon_container, faker):
         cont = DatabaseConnector(oricon_container)
@@ -109,7 +130,7 @@ class TestDatabaseSaver:
         )
         week_session = db_session_container.week()
         item_session = db_session_container.item()
-        title = await cont.handle_title("test")
+        (title,) = await cont.handle_titles(["test"])
         item = Item(
             rating=1,
             volume=2,
@@ -123,8 +144,11 @@ class TestDatabaseSaver:
         week_session.add(week)
         session = db_session_container.session()
         await session.commit()
-        res = await cont.get_previous_place(week, 1, "test")
-        assert res == PreviousRank.SAME.name
+        content = Content(
+            name="test", volume=3, image=None, authors=[], publishers=[], rating=1
+        )
+        res = await cont.get_previous_places(week, [content])
+        assert res == {("test", 1): PreviousRank.SAME}
 
     async def test_handle_authors(self, db_session_container, oricon_container):
         cont = DatabaseConnector(oricon_container)
@@ -137,7 +161,7 @@ class TestDatabaseSaver:
         assert len(res) == 2
         assert res[0].name == "test"
         assert res[0].id == 1
-        assert res[1].id == None
+        assert res[1].id is not None
 
     async def test_handle_publishers(self, db_session_container, oricon_container):
         cont = DatabaseConnector(oricon_container)
@@ -150,4 +174,191 @@ class TestDatabaseSaver:
         assert len(res) == 2
         assert res[0].name == "test"
         assert res[0].id == 1
-        assert res[1].id == None
+        assert res[1].id is not None
+
+    async def test_handle_titles(self, db_session_container, oricon_container):
+        cont = DatabaseConnector(oricon_container)
+        title_session = db_session_container.title()
+        title_session.add(Title(name="test"))
+        session = db_session_container.session()
+        await session.commit()
+        res = await cont.handle_titles(["test", "test2", "test2"])
+        assert len(res) == 2
+        assert res[0].name == "test"
+        assert res[0].id == 1
+        assert res[1].name == "test2"
+        assert res[1].id is not None
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_data_shared_names(
+        self, mock, db_session_container, oricon_container, faker
+    ):
+        dte = datetime.date(2022, 11, 11)
+        authors = [faker.name() for _ in range(2)]
+        contents = [
+            Content(
+                name="test" if x % 2 else "test2",
+                volume=x,
+                image=faker.pystr(max_chars=40, suffix=".jpg"),
+                authors=authors,
+                publishers=["publisher"],
+                rating=x,
+            )
+            for x in range(1, 5)
+        ]
+        mock.return_value = contents
+        cont = DatabaseConnector(oricon_container)
+        await cont.insert_data(dte)
+        items = db_session_container.item()
+        res = await items.get_instance(dte.strftime("%Y-%m-%d"))
+        assert len(res) == 4
+        assert all(sorted(item.authors) == sorted(authors) for item in res)
+        titles = await db_session_container.title().get_all()
+        assert len(titles) == 2
+        publishers = await db_session_container.publishers().filter_by_name(
+            ["publisher"]
+        )
+        assert len(publishers) == 1
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_data_existing_week(
+        self, mock, db_session_container, oricon_container, faker
+    ):
+        dte = datetime.date(2022, 11, 11)
+        week_session = db_session_container.week()
+        week_session.add(Week(date=dte, source_type_id=pytest.source_types[0].id))
+        session = db_session_container.session()
+        await session.commit()
+        mock.return_value = [
+            Content(
+                name="test",
+                volume=1,
+                image=None,
+                authors=[faker.name()],
+                publishers=[faker.name()],
+                rating=1,
+            )
+        ]
+        cont = DatabaseConnector(oricon_container)
+        await cont.insert_data(dte)
+        items = db_session_container.item()
+        count = await items.get_count()
+        assert count == 0
+        weeks = await week_session.get_all()
+        assert len(weeks) == 1
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_data_title_metadata(
+        self, mock, db_session_container, oricon_container, aux_container
+    ):
+        metadata_cache = aux_container.metadata_cache()
+        metadata_cache.set("テスト", ("test", ["author"], ["publisher"]))
+        mock.return_value = [
+            Content(
+                name="test",
+                volume=1,
+                image=None,
+                authors=["author"],
+                publishers=["publisher"],
+                rating=1,
+            )
+        ]
+        cont = DatabaseConnector(oricon_container)
+        await cont.insert_data(datetime.date(2022, 11, 11))
+        assert metadata_cache.pending == {}
+        rows = await db_session_container.title_metadata().get_recent(10)
+        assert [
+            (x.original_title, x.name, x.authors, x.publishers) for x in rows
+        ] == [("テスト", "test", ["author"], ["publisher"])]
+        found = await lookup_title_metadata(["テスト", "other"], asyncio.Lock())
+        assert found == {"テスト": ("test", ["author"], ["publisher"])}
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_data_title_metadata_rollback(
+        self, get_data, db_session_container, oricon_container, aux_container
+    ):
+        metadata_cache = aux_container.metadata_cache()
+        metadata_cache.set("テスト", ("test", ["author"], ["publisher"]))
+        get_data.return_value = [
+            Content(
+                name="test",
+                volume=1,
+                image=None,
+                authors=["author"],
+                publishers=["publisher"],
+                rating=1,
+            )
+        ]
+        cont = DatabaseConnector(oricon_container)
+        session = db_session_container.session()
+        with pytest.raises(Exception), mock.patch.object(
+            session, "commit", side_effect=Exception("fail")
+        ):
+            await cont.insert_data(datetime.date(2022, 11, 11))
+        # data of titles is written with next week
+        assert metadata_cache.pending == {
+            "テスト": ("test", ["author"], ["publisher"])
+        }
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_weeks(
+        self, mock, db_session_container, oricon_container, faker
+    ):
+        dates = [datetime.date(2022, 11, 4), datetime.date(2022, 11, 11)]
+        mock.side_effect = [
+            [
+                Content(
+                    name="test",
+                    volume=1,
+                    image=None,
+                    authors=[faker.name()],
+                    publishers=[faker.name()],
+                    rating=rating,
+                )
+            ]
+            for rating in (1, 2)
+        ]
+        cont = DatabaseConnector(oricon_container)
+        await cont.insert_weeks(dates, parallel_weeks=2)
+        items = db_session_container.item()
+        res = await items.get_instance(dates[1].strftime("%Y-%m-%d"))
+        assert len(res) == 1
+        assert res[0].previous_rank == PreviousRank.DOWN
+
+    @mock.patch(
+        "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.get_data"
+    )
+    async def test_insert_weeks_failed(
+        self, mock, db_session_container, oricon_container, faker
+    ):
+        dates = [datetime.date(2022, 11, x) for x in (4, 11, 18)]
+        content = Content(
+            name="test",
+            volume=1,
+            image=None,
+            authors=[faker.name()],
+            publishers=[faker.name()],
+            rating=1,
+        )
+        mock.side_effect = [[content], Exception("fail"), [content]]
+        cont = DatabaseConnector(oricon_container)
+        with pytest.raises(Exception):
+            await cont.insert_weeks(dates, parallel_weeks=1)
+        # cancelled scrapers are finished before insert_weeks returns
+        assert all(
+            task.done()
+            for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        )
+        weeks = await db_session_container.week().get_all()
+        assert [x[0].date for x in weeks] == dates[:1]
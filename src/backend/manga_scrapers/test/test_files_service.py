@@ -0,0 +1,38 @@
+import pytest
+from manga_scrapers.services import files_service
+from manga_scrapers.services.files_service import (
+    delete_images,
+    find_image,
+    save_image,
+)
+
+
+@pytest.fixture(autouse=True)
+def images_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(files_service, "IMAGES_PATH", str(tmp_path))
+    monkeypatch.setattr(files_service, "IMAGE_STORE_PATH", str(tmp_path / "store"))
+    yield tmp_path
+
+
+def test_save_image_deduplicated(images_path):
+    name = save_image("Oricon", "Weekly", b"img", "2022-11-04", "title", 1)
+    name2 = save_image("Oricon", "Weekly", b"img", "2022-11-11")
+    assert name == name2
+    assert (images_path / "oricon/weekly/2022-11-04" / name).read_bytes() == b"img"
+    assert (images_path / "oricon/weekly/2022-11-11" / name).read_bytes() == b"img"
+    assert len(list((images_path / "store/blobs").iterdir())) == 1
+
+
+def test_find_image(images_path):
+    assert find_image("Oricon", "Weekly", "2022-11-11", "title", 1) is None
+    name = save_image("Oricon", "Weekly", b"img", "2022-11-04", "title", 1)
+    assert find_image("Oricon", "Weekly", "2022-11-11", "title", 2) is None
+    assert find_image("Shoseki", "Weekly", "2022-11-11", "title", 1) == name
+    assert (images_path / "shoseki/weekly/2022-11-11" / name).exists()
+
+
+def test_delete_images_keeps_store(images_path):
+    name = save_image("Oricon", "Weekly", b"img", "2022-11-04", "title", 1)
+    delete_images("Oricon", "Weekly", "2022-11-04")
+    assert not (images_path / "oricon/weekly/2022-11-04").exists()
+    assert find_image("Oricon", "Weekly", "2022-11-11", "title", 1) == name
@@ -165,6 +165,65 @@ class TestOriconScraper:
         )
         assert date == None
 
+    async def test_list_available_dates(self, aioresponse, oricon_container):
+        available = [datetime.date(2022, 10, 14), datetime.date(2022, 10, 21)]
+        for x in range(1, 15):
+            date = datetime.date(2022, 10, 11) + datetime.timedelta(days=x)
+            aioresponse.get(
+                update_url(
+                    oricon_container.MAIN_URL,
+                    path=[date.strftime("%Y-%m-%d")],
+                    trailing_slash=True,
+                ),
+                status=200 if date in available else 404,
+            )
+        dates = await oricon_container.list_available_dates(
+            datetime.date(2022, 10, 11), datetime.date(2022, 10, 25)
+        )
+        assert dates == available
+
+    @mock.patch(
+        "manga_scrapers.client_handler.retry_policy.random.uniform", return_value=0
+    )
+    async def test_list_available_dates_failed_probe(
+        self, uniform, aioresponse, oricon_container
+    ):
+        available = [datetime.date(2022, 10, 14), datetime.date(2022, 10, 21)]
+        failed = datetime.date(2022, 10, 16)
+        for x in range(1, 15):
+            date = datetime.date(2022, 10, 11) + datetime.timedelta(days=x)
+            aioresponse.get(
+                update_url(
+                    oricon_container.MAIN_URL,
+                    path=[date.strftime("%Y-%m-%d")],
+                    trailing_slash=True,
+                ),
+                status=503 if date == failed else 200 if date in available else 404,
+                repeat=date == failed,
+            )
+        # probe that exhausts its retries doesn't abort the others
+        dates = await oricon_container.list_available_dates(
+            datetime.date(2022, 10, 11), datetime.date(2022, 10, 25)
+        )
+        assert dates == available
+
+    async def test_list_available_dates_backward(self, aioresponse, oricon_container):
+        available = [datetime.date(2022, 10, 14), datetime.date(2022, 10, 21)]
+        for x in range(0, 21):
+            date = datetime.date(2022, 10, 21) - datetime.timedelta(days=x)
+            aioresponse.get(
+                update_url(
+                    oricon_container.MAIN_URL,
+                    path=[date.strftime("%Y-%m-%d")],
+                    trailing_slash=True,
+                ),
+                status=200 if date in available else 404,
+            )
+        dates = await oricon_container.list_available_dates(
+            None, datetime.date(2022, 10, 21)
+        )
+        assert dates == available
+
     @mock.patch("manga_scrapers.scrapers.meta.AbstractBase.fetch")
     async def test_get_aux_data(
         self,
@@ -182,6 +241,24 @@ class TestOriconScraper:
         assert publishers == ["Shogakukan"]
         assert name == "Akatsuki no Aria"
 
+    @mock.patch("manga_scrapers.scrapers.meta.AbstractBase.fetch")
+    async def test_get_aux_data_cached(
+        self,
+        mock,
+        oricon_container,
+        manga_updates_container,
+        oricon_item,
+        manga_updates_title,
+        manga_updates_list,
+    ):
+        mock.side_effect = [manga_updates_list, manga_updates_title]
+        oricon_item.find("h2", {"class": "title"}).string = "暁のARIA"
+        first = await oricon_container._get_aux_data(oricon_item)
+        second = await oricon_container._get_aux_data(oricon_item)
+        assert mock.call_count == 2
+        assert first == second
+        assert first == ("Akatsuki no Aria", ["AKAISHI Michiyo"], ["Shogakukan"])
+
     @mock.patch("manga_scrapers.scrapers.meta.AbstractBase.fetch")
     async def test_get_aux_data_exception(
         self,
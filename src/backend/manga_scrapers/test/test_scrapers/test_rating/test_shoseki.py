@@ -189,6 +189,21 @@ class TestShosekiScraper:
                 datetime.date(2022, 11, 11), "forward"
             )
 
+    async def test_list_available_dates(
+        self, aioresponse, shoseki_container, shoseki_list
+    ):
+        aioresponse.get(shoseki_container.MAIN_URL, status=200, body=str(shoseki_list))
+        dates = await shoseki_container.list_available_dates(
+            datetime.date(2022, 10, 11), datetime.date(2022, 10, 25)
+        )
+        assert dates == [datetime.date(2022, 10, 18), datetime.date(2022, 10, 25)]
+        # main page is fetched only once
+        dates = await shoseki_container.list_available_dates(
+            None, datetime.date(2022, 10, 4)
+        )
+        assert dates[-1] == datetime.date(2022, 10, 4)
+        assert dates == sorted(dates)
+
     async def test_get_aux_data(
         self,
         aioresponse,
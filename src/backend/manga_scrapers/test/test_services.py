@@ -1,6 +1,10 @@
+import asyncio
 import datetime
 from unittest import mock
 import pytest_asyncio
+from manga_scrapers.containers.client_container import ClientContainer
+from manga_scrapers.containers.image_container import ImageScrapingContainer
+from manga_scrapers.containers.title_data_container import AuxScrapingContainer
 from manga_scrapers.services.db_service import get_date_list
 from manga_scrapers.scrapers.rating_scrapers.oricon_scraper import (
     OriconWeeklyScraper,
@@ -10,9 +14,12 @@ from manga_scrapers.scrapers.rating_scrapers.shoseki_scraper import (
 )
 from manga_scrapers.services.db_service import (
     execute_scraper,
-    get_date,
+    execute_scrapers,
+    plan_dates,
+    get_scraper_names,
     scraper_factory,
 )
+from manga_scrapers.services.title_metadata_service import TitleMetadataCache
 from manga_scrapers.test.conftest import *
 from manga_scrapers.utils.url_handler import update_url
 from manga_sales.db.models import Week
@@ -32,104 +39,94 @@ async def test_scraper_factory(containers):
     assert isinstance(res2, ShosekiWeeklyScraper)
 
 
-@pytest.mark.usefixtures("create_data_scraper")
-async def test_get_date(aioresponse, db_session_container, oricon_container):
-    scraper = await scraper_factory("oricon_scraper")
-    dates = [datetime.date.today() - datetime.timedelta(days=x) for x in range(1, 5)]
-    for x in dates[:-1]:
-        aioresponse.get(
-            update_url(
-                scraper.MAIN_URL,
-                path=[x.strftime("%Y-%m-%d")],
-                trailing_slash=True,
-            ),
-            status=404,
-        )
-    aioresponse.get(
-        update_url(
-            scraper.MAIN_URL,
-            path=[dates[-1].strftime("%Y-%m-%d")],
-            trailing_slash=True,
-        ),
-        status=200,
-    )
-    res = await get_date(scraper)
-    assert res == dates[-1]
+async def test_containers_share_client():
+    client = ClientContainer()
+    data_cont = DataScrapingContainer(client=client)
+    aux_cont = AuxScrapingContainer(client=client)
+    img_cont = ImageScrapingContainer(client=client)
+    oricon = await data_cont.oricon_scraper()
+    amazon = await aux_cont.amazon_scraper()
+    cdjapan = await img_cont.cdjapan_scraper()
+    assert oricon.session is amazon.session is cdjapan.session
+    # connection pool is owned by container, not by session
+    connector = await client.connector()
+    assert oricon.session.session.connector is connector
+    await client.shutdown_resources()
+    assert connector.closed
+    for container in (data_cont, aux_cont, img_cont):
+        container.unwire()
 
 
-@pytest.mark.usefixtures("create_data_scraper")
-async def test_get_date_none(aioresponse, db_session_container, oricon_container):
-    scraper = await scraper_factory("oricon_scraper")
-    dates = [datetime.date.today() - datetime.timedelta(days=x) for x in range(1, 9)]
-    for x in dates:
-        aioresponse.get(
-            update_url(
-                scraper.MAIN_URL,
-                path=[x.strftime("%Y-%m-%d")],
-                trailing_slash=True,
-            ),
-            status=404,
-        )
-    res = await get_date(scraper)
-    assert res == None
+def test_plan_dates():
+    dates = [datetime.date(2022, 9, x) for x in (5, 12, 12, 19)]
+    existing = {(datetime.date(2022, 9, 12), 1), (datetime.date(2022, 9, 19), 2)}
+    assert plan_dates(dates[::-1], existing, 1) == [
+        datetime.date(2022, 9, 5),
+        datetime.date(2022, 9, 19),
+    ]
 
 
 @pytest.mark.usefixtures("create_data_scraper")
-async def test_get_date_recursive(aioresponse, db_session_container, oricon_container):
-    scraper = await scraper_factory("oricon_scraper")
-    dates = [datetime.date.today() + datetime.timedelta(days=x) for x in range(1, 10)]
-    for x in dates[:5]:
-        aioresponse.get(
-            update_url(
-                scraper.MAIN_URL,
-                path=[x.strftime("%Y-%m-%d")],
-                trailing_slash=True,
-            ),
-            status=404,
-        )
-    aioresponse.get(
-        update_url(
-            scraper.MAIN_URL,
-            path=[dates[5].strftime("%Y-%m-%d")],
-            trailing_slash=True,
-        ),
-        status=200,
-    )
-    for x in dates[6:-1]:
-        aioresponse.get(
-            update_url(
-                scraper.MAIN_URL,
-                path=[x.strftime("%Y-%m-%d")],
-                trailing_slash=True,
-            ),
-            status=404,
-        )
-    aioresponse.get(
-        update_url(
-            scraper.MAIN_URL,
-            path=[dates[-1].strftime("%Y-%m-%d")],
-            trailing_slash=True,
-        ),
-        status=200,
-    )
-
+@mock.patch(
+    "manga_scrapers.scrapers.rating_scrapers.oricon_scraper.OriconWeeklyScraper.list_available_dates"
+)
+async def test_get_date_list(mock, db_session_container, oricon_container):
+    date_list = [
+        datetime.date.today() - datetime.timedelta(days=x) for x in range(1, 5)
+    ][::-1]
+    db_lock = asyncio.Lock()
+    # discovery runs without holding lock of database session
+    mock.side_effect = lambda *args: date_list if not db_lock.locked() else []
     week_session = db_session_container.week()
-    week = Week(date=dates[5], source_type_id=pytest.source_types[0].id)
+    week = Week(date=date_list[1], source_type_id=pytest.source_types[0].id)
     week_session.add(week)
+    week_shoseki = Week(date=date_list[2], source_type_id=pytest.source_types[1].id)
+    week_session.add(week_shoseki)
     session = db_session_container.session()
     await session.commit()
+    scraper = await scraper_factory("oricon_scraper")
+    result = await get_date_list(scraper, db_lock)
+    assert mock.call_args.args == (date_list[1], datetime.date.today())
+    assert result == [date_list[0], date_list[2], date_list[3]]
 
-    res = await get_date(scraper)
-    assert res == dates[-1]
 
+def test_title_metadata_cache():
+    cache = TitleMetadataCache(2)
+    cache.load([("b", ("B", [], [])), ("a", ("A", [], []))])
+    assert cache.loaded
+    cache.get("a")
+    cache.set("c", ("C", ["author"], []))
+    assert cache.get("b") is None
+    assert cache.get("a") == ("A", [], [])
+    assert cache.pop_pending() == {"c": ("C", ["author"], [])}
+    assert cache.pending == {}
+    cache.set("d", ("D", [], []))
+    cache.requeue({"c": ("C", ["author"], []), "d": ("old", [], [])})
+    assert cache.pending == {"d": ("D", [], []), "c": ("C", ["author"], [])}
 
-@mock.patch("manga_scrapers.services.db_service.get_date")
-async def test_get_date_list(mock, oricon_container):
-    date_list = [
-        datetime.date.today() + datetime.timedelta(days=x) for x in range(1, 5)
-    ][::-1]
-    date_list.append(None)
-    mock.side_effect = date_list
-    scraper = await scraper_factory("oricon_scraper")
-    result = await get_date_list(scraper)
-    assert result == sorted(date_list[:-1])
+
+async def test_title_metadata_cache_preload():
+    cache = TitleMetadataCache(10)
+    cache.load([("a", ("A", [], []))])
+    cache.loader = mock.AsyncMock(return_value={"b": ("B", [], [])})
+    await cache.preload(["a", "b", "c", "b"])
+    # only titles missing in cache are looked up
+    cache.loader.assert_awaited_once_with(["b", "c"])
+    assert cache.get("b") == ("B", [], [])
+    assert cache.get("c") is None
+    await cache.preload(["a", "b"])
+    assert cache.loader.await_count == 1
+
+
+def test_get_scraper_names():
+    assert get_scraper_names() == ["oricon_scraper", "shoseki_scraper"]
+
+
+@mock.patch("manga_scrapers.services.db_service.run_scraper")
+async def test_execute_scrapers_failure_isolation(mock):
+    mock.side_effect = [Exception("fail"), None]
+    await execute_scrapers(["oricon_scraper", "shoseki_scraper"], 2)
+    assert [x.args[0] for x in mock.call_args_list] == [
+        "oricon_scraper",
+        "shoseki_scraper",
+    ]